@@ -1,8 +1,15 @@
 """Event handlers for domain events."""
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import TYPE_CHECKING
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+import orjson
 
 if TYPE_CHECKING:
     from app.domain.events import (
@@ -17,30 +24,136 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Guards register_event_handlers so repeated calls do not re-subscribe
+_registered = False
+_register_lock = threading.Lock()
+
+
+class _LogBuffer:
+    """Bounded queue drained by a daemon thread that emits log lines in batches.
+
+    Records are plain dicts; JSON serialization happens on the drain thread so
+    publishers only pay for a non-blocking enqueue.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self._queue: queue.Queue[Dict[str, Any] | None] = queue.Queue(maxsize=maxsize)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="audit-log-buffer", daemon=True)
+        self._thread.start()
+
+    def put_nowait(self, record: Dict[str, Any]) -> None:
+        """Enqueue a record; raises queue.Full when the buffer is saturated."""
+        self._queue.put_nowait(record)
+
+    def _collect(self) -> List[bytes]:
+        """Pull up to batch_size records or wait flush_interval, whichever first.
+
+        Once closed, whatever is already queued is drained without blocking.
+        """
+        lines: List[bytes] = []
+        deadline = time.monotonic() + self._flush_interval
+        while len(lines) < self._batch_size:
+            try:
+                if self._closed.is_set():
+                    record = self._queue.get_nowait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    record = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if record is None:
+                # Wake-up sentinel from flush_and_close
+                continue
+            lines.append(orjson.dumps(record))
+        return lines
+
+    def _emit(self, lines: List[bytes]) -> None:
+        if lines:
+            # One JSON document per line
+            logger.info(b"\n".join(lines).decode())
+
+    def _run(self) -> None:
+        while True:
+            self._emit(self._collect())
+            if self._closed.is_set() and self._queue.empty():
+                return
+
+    def flush_and_close(self) -> None:
+        """Stop the drain thread after it has emitted everything still queued."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            # Wake the drain thread if it is blocked waiting for records
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self._thread.join()
+
 
 class AuditLogHandler:
-    """Logs all domain events for audit trail."""
-    
+    """Logs all domain events for audit trail as JSON lines.
+
+    Records are buffered and written in batches off the publishing thread;
+    records arriving while the buffer is full are counted in ``dropped``.
+    """
+
+    def __init__(self, buffer_size: int = 10_000, flush_interval: float = 0.5) -> None:
+        self._buf = _LogBuffer(maxsize=buffer_size, flush_interval=flush_interval)
+        self._dropped = 0
+        atexit.register(self._buf.flush_and_close)
+
+    @property
+    def dropped(self) -> int:
+        """Number of audit records discarded because the buffer was full."""
+        return self._dropped
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        try:
+            self._buf.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+
+    def close(self) -> None:
+        """Drain pending audit records and stop the background writer for good."""
+        atexit.unregister(self._buf.flush_and_close)
+        self._buf.flush_and_close()
+
     def handle_project_created(self, event: ProjectCreated) -> None:
-        logger.info(f"[AUDIT] Project created: {event.aggregate_id} - {event.name}")
-    
+        self._record({"event": "project_created", "id": event.aggregate_id, "name": event.name})
+
     def handle_project_deleted(self, event: ProjectDeleted) -> None:
-        logger.info(f"[AUDIT] Project deleted: {event.aggregate_id} - {event.name}")
-    
+        self._record({"event": "project_deleted", "id": event.aggregate_id, "name": event.name})
+
     def handle_graph_created(self, event: GraphCreated) -> None:
-        logger.info(f"[AUDIT] Graph created: {event.aggregate_id} in project {event.project_id}")
-    
+        self._record({"event": "graph_created", "id": event.aggregate_id, "project_id": event.project_id})
+
     def handle_graph_deleted(self, event: GraphDeleted) -> None:
-        logger.info(f"[AUDIT] Graph deleted: {event.aggregate_id}")
-    
+        self._record({"event": "graph_deleted", "id": event.aggregate_id})
+
     def handle_model_uploaded(self, event: ModelUploaded) -> None:
-        logger.info(f"[AUDIT] Model uploaded: {event.model_id} - {event.name} ({event.framework})")
-    
+        self._record({
+            "event": "model_uploaded",
+            "id": event.model_id,
+            "name": event.name,
+            "framework": event.framework,
+        })
+
     def handle_model_deleted(self, event: ModelDeleted) -> None:
-        logger.info(f"[AUDIT] Model deleted: {event.model_id}")
-    
+        self._record({"event": "model_deleted", "id": event.model_id})
+
     def handle_metrics_recorded(self, event: MetricsRecorded) -> None:
-        logger.info(f"[AUDIT] Metrics recorded for node {event.node_id} in graph {event.graph_id}")
+        self._record({"event": "metrics_recorded", "id": event.node_id, "graph_id": event.graph_id})
 
 
 class CacheWarmingHandler:
@@ -48,7 +161,7 @@ class CacheWarmingHandler:
     
     def handle_model_uploaded(self, event: ModelUploaded) -> None:
         # In a real implementation, this would trigger background cache warming
-        logger.info(f"[CACHE] Warming cache for model {event.model_id}")
+        logger.info("[CACHE] Warming cache for model %s", event.model_id)
 
 
 class NotificationHandler:
@@ -56,20 +169,35 @@ class NotificationHandler:
     
     def handle_project_created(self, event: ProjectCreated) -> None:
         # In a real implementation, send email/webhook
-        logger.info(f"[NOTIFICATION] New project: {event.name}")
+        logger.info("[NOTIFICATION] New project: %s", event.name)
     
     def handle_model_uploaded(self, event: ModelUploaded) -> None:
-        logger.info(f"[NOTIFICATION] New model uploaded: {event.name} in graph {event.graph_id}")
+        logger.info("[NOTIFICATION] New model uploaded: %s in graph %s", event.name, event.graph_id)
     
     def handle_metrics_recorded(self, event: MetricsRecorded) -> None:
         # Could trigger alerts if metrics are below threshold
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         accuracy = event.metrics.get("accuracy")
         if accuracy and accuracy < 0.5:
-            logger.warning(f"[NOTIFICATION] Low accuracy ({accuracy}) for node {event.node_id}")
+            logger.warning("[NOTIFICATION] Low accuracy (%s) for node %s", accuracy, event.node_id)
 
 
 def register_event_handlers():
-    """Register all event handlers with the publisher."""
+    """Register all event handlers with the publisher.
+
+    Only the first call has any effect; later calls return without starting
+    another audit writer or subscribing the handlers twice.
+    """
+    global _registered
+    with _register_lock:
+        if _registered:
+            return
+        _register_handlers()
+        _registered = True
+
+
+def _register_handlers() -> None:
     from app.domain.events import (
         event_publisher,
         ProjectCreated,
@@ -80,25 +208,33 @@ def register_event_handlers():
         ModelDeleted,
         MetricsRecorded,
     )
-    
-    audit = AuditLogHandler()
+    from app.config import settings
+
+    audit = AuditLogHandler(
+        buffer_size=settings.AUDIT_BUFFER_SIZE,
+        flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+    )
     cache = CacheWarmingHandler()
     notification = NotificationHandler()
     
+    mapping: Dict[type, List[Callable[[Any], None]]] = defaultdict(list)
+
     # Audit handlers (all events)
-    event_publisher.subscribe(ProjectCreated, audit.handle_project_created)
-    event_publisher.subscribe(ProjectDeleted, audit.handle_project_deleted)
-    event_publisher.subscribe(GraphCreated, audit.handle_graph_created)
-    event_publisher.subscribe(GraphDeleted, audit.handle_graph_deleted)
-    event_publisher.subscribe(ModelUploaded, audit.handle_model_uploaded)
-    event_publisher.subscribe(ModelDeleted, audit.handle_model_deleted)
-    event_publisher.subscribe(MetricsRecorded, audit.handle_metrics_recorded)
+    mapping[ProjectCreated].append(audit.handle_project_created)
+    mapping[ProjectDeleted].append(audit.handle_project_deleted)
+    mapping[GraphCreated].append(audit.handle_graph_created)
+    mapping[GraphDeleted].append(audit.handle_graph_deleted)
+    mapping[ModelUploaded].append(audit.handle_model_uploaded)
+    mapping[ModelDeleted].append(audit.handle_model_deleted)
+    mapping[MetricsRecorded].append(audit.handle_metrics_recorded)
     
     # Cache warming
-    event_publisher.subscribe(ModelUploaded, cache.handle_model_uploaded)
+    mapping[ModelUploaded].append(cache.handle_model_uploaded)
     
     # Notifications
-    event_publisher.subscribe(ProjectCreated, notification.handle_project_created)
-    event_publisher.subscribe(ModelUploaded, notification.handle_model_uploaded)
-    event_publisher.subscribe(MetricsRecorded, notification.handle_metrics_recorded)
+    mapping[ProjectCreated].append(notification.handle_project_created)
+    mapping[ModelUploaded].append(notification.handle_model_uploaded)
+    mapping[MetricsRecorded].append(notification.handle_metrics_recorded)
 
+    event_publisher.bulk_subscribe(mapping)
+    event_publisher.compile()
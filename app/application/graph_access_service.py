@@ -1,6 +1,8 @@
 """Service for graph access validation and ownership checks."""
 from __future__ import annotations
 
+from typing import Any, Dict
+
 from app.domain.ports import StoragePort
 from app.domain.errors import NotFoundError, ValidationError
 
@@ -23,14 +25,17 @@ class GraphAccessService:
         if not graph:
             raise NotFoundError(f"Graph not found: {graph_id}")
 
-    def require_graph_in_project(self, project_id: str, graph_id: str) -> None:
-        """Raise NotFoundError if graph doesn't exist, ValidationError if wrong project."""
-        self.require_project_exists(project_id)
+    def require_graph_in_project(self, project_id: str, graph_id: str) -> Dict[str, Any]:
+        """Return the graph; raise NotFoundError if it doesn't exist, ValidationError if wrong project."""
         graph = self._storage.get_graph(graph_id)
+        if graph and graph["project_id"] == project_id:
+            # Graphs are removed with their project, so ownership implies existence
+            return graph
+        # A missing project takes precedence over both graph errors
+        self.require_project_exists(project_id)
         if not graph:
             raise NotFoundError(f"Graph not found: {graph_id}")
-        if graph["project_id"] != project_id:
-            raise ValidationError("Graph does not belong to specified project")
+        raise ValidationError("Graph does not belong to specified project")
 
     def require_node_exists(self, graph_id: str, node_id: str) -> None:
         """Raise NotFoundError if node doesn't exist in graph."""
@@ -23,11 +23,8 @@ class GraphValidationService:
         self, project_id: str, name: str, exclude_id: str | None = None
     ) -> None:
         """Check if graph name already exists in project."""
-        existing_graphs = self._storage.get_project_graphs(project_id)
-        for graph in existing_graphs:
-            if graph["name"].lower() == name.lower():
-                if exclude_id is None or graph["id"] != exclude_id:
-                    raise ConflictError(
-                        f"Graph with name '{name}' already exists in this project"
-                    )
+        if self._storage.graph_name_exists(project_id, name, exclude_id=exclude_id):
+            raise ConflictError(
+                f"Graph with name '{name}' already exists in this project"
+            )
 
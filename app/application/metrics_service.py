@@ -1,61 +1,230 @@
 """Service for metrics operations, extracted from storage layer."""
 from __future__ import annotations
 
+import logging
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, FrozenSet, Set, Tuple
 
 from app.domain.ports import StoragePort
 from app.domain.errors import NotFoundError
-from app.domain.events import event_publisher, MetricsRecorded
+
+logger = logging.getLogger(__name__)
+
+# Graphs whose node ids are held for existence checks between flushes
+KNOWN_NODES_MAX_GRAPHS = 1024
+
+
+@lru_cache(maxsize=1)
+def _fmt_second(epoch_s: int) -> str:
+    """ISO-format a whole second; consecutive calls in the same second hit the cache."""
+    return datetime.fromtimestamp(epoch_s).isoformat()
+
+
+def _metrics_timestamp() -> str:
+    """Local ISO timestamp with microseconds, without building a datetime per call."""
+    now = time.time()
+    seconds = int(now)
+    return f"{_fmt_second(seconds)}.{int((now - seconds) * 1e6):06d}"
+
+
+@lru_cache(maxsize=1)
+def _get_events() -> ModuleType:
+    """Import the domain events module on first publish rather than at import time."""
+    from app.domain import events
+    return events
 
 
 class MetricsService:
-    """Encapsulates metrics domain logic."""
+    """Encapsulates metrics domain logic.
 
-    def __init__(self, storage: StoragePort) -> None:
+    Metric updates are staged per graph and written with one load/save per
+    graph when ``flush`` runs: after ``flush_interval`` seconds, once
+    ``buffer_size`` nodes have pending updates, or on demand. A ``flush_interval``
+    of 0 writes through on every call. Readers of node metadata call
+    ``flush(graph_id)`` first, and deletes call ``discard`` so staged
+    updates for removed nodes or graphs are dropped with them.
+
+    Each graph is written under the storage's ``graph_write_lock``, the
+    lock node and edge writes hold, so a flush never overwrites them.
+    Disk I/O happens outside the staging lock, and a batch that fails to
+    write is logged and staged again for the next flush.
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        buffer_size: int = 256,
+        flush_interval: float = 1.0,
+    ) -> None:
         self._storage = storage
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        # Guards the staging state below; never held across disk I/O
+        self._lock = threading.Lock()
+        # Serializes flushes, so an older batch never lands after a newer one
+        self._flush_lock = threading.Lock()
+        # graph_id -> node_id -> {"score": value?, "meta": {...}}
+        self._pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty: Set[str] = set()
+        self._staged_count = 0
+        self._timer: threading.Timer | None = None
+        # graph_id -> (loaded_at, node ids) used only to confirm node existence
+        self._known_nodes: Dict[str, Tuple[float, FrozenSet[str]]] = {}
 
     def add_node_metrics(
         self, graph_id: str, node_id: str, metrics: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Add metrics to a node in a graph."""
-        ursaml_data = self._storage.load_graph_ursaml(graph_id)
-        if not ursaml_data or node_id not in ursaml_data["nodes"]:
+        if not self._node_exists(graph_id, node_id):
             raise NotFoundError(f"Node {node_id} not found in graph {graph_id}")
 
-        # Update score column if present
-        if "accuracy" in metrics and "score" in ursaml_data["nodes"][node_id]["columns"]:
-            ursaml_data["nodes"][node_id]["columns"]["score"] = metrics["accuracy"]
+        self._stage_metrics(graph_id, node_id, metrics)
+        
+        # Publish domain event
+        events = _get_events()
+        events.event_publisher.publish(events.MetricsRecorded.for_node(graph_id, node_id, metrics))
+        
+        return metrics
+
+    def flush(self, graph_id: str | None = None) -> None:
+        """Write staged metrics to storage, for one graph or all dirty graphs."""
+        with self._flush_lock:
+            with self._lock:
+                if graph_id is None:
+                    # Entries only outlive one flush interval anyway; dropping them
+                    # here keeps the cache bounded by the graphs written below
+                    self._known_nodes.clear()
+                graph_ids = [graph_id] if graph_id is not None else list(self._dirty)
+                batches = {
+                    gid: self._pending.pop(gid)
+                    for gid in graph_ids
+                    if gid in self._pending
+                }
+                self._dirty.difference_update(batches)
+                self._staged_count = sum(len(nodes) for nodes in self._pending.values())
+                if not self._dirty and self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
 
-        # Add metrics to detailed metadata
-        if "meta" not in ursaml_data["nodes"][node_id]["detailed"]:
-            ursaml_data["nodes"][node_id]["detailed"]["meta"] = {}
+            for gid, node_updates in batches.items():
+                try:
+                    self._write_graph(gid, node_updates)
+                except Exception:
+                    logger.exception("Failed to write staged metrics for graph %s; re-staging", gid)
+                    self._restage(gid, node_updates)
 
-        ursaml_data["nodes"][node_id]["detailed"]["meta"].update(
-            {
-                "score": metrics.get("accuracy", 0.0),
-                "loss": metrics.get("loss", 0.0),
-                "epochs": metrics.get("epochs", 0),
-                "metrics_timestamp": datetime.now().isoformat(),
-            }
-        )
+    def discard(self, graph_id: str, node_id: str | None = None) -> None:
+        """Drop staged metrics for a deleted node, or for a whole deleted graph."""
+        with self._lock:
+            self._known_nodes.pop(graph_id, None)
+            node_updates = self._pending.get(graph_id)
+            if node_updates is None:
+                return
+            if node_id is None:
+                node_updates.clear()
+            else:
+                node_updates.pop(node_id, None)
+            if not node_updates:
+                del self._pending[graph_id]
+                self._dirty.discard(graph_id)
+            self._staged_count = sum(len(nodes) for nodes in self._pending.values())
 
+    # --------------- Internal helpers ---------------
+    def _node_exists(self, graph_id: str, node_id: str) -> bool:
+        cached = self._known_nodes.get(graph_id)
+        if cached is not None and time.monotonic() - cached[0] < self._flush_interval:
+            if node_id in cached[1]:
+                return True
+        # Cache miss (or node created after the cached load): re-read once
+        ursaml_data = self._storage.load_graph_ursaml(graph_id)
+        if not ursaml_data:
+            self._known_nodes.pop(graph_id, None)
+            return False
+        if len(self._known_nodes) >= KNOWN_NODES_MAX_GRAPHS:
+            self._known_nodes.clear()
+        self._known_nodes[graph_id] = (time.monotonic(), frozenset(ursaml_data["nodes"]))
+        return node_id in ursaml_data["nodes"]
+
+    def _stage_metrics(self, graph_id: str, node_id: str, metrics: Dict[str, Any]) -> None:
+        meta = {
+            "score": metrics.get("accuracy", 0.0),
+            "loss": metrics.get("loss", 0.0),
+            "epochs": metrics.get("epochs", 0),
+            "metrics_timestamp": _metrics_timestamp(),
+        }
         # Add additional metrics
         for key, value in metrics.items():
             if key not in ["accuracy", "loss", "epochs"]:
-                ursaml_data["nodes"][node_id]["detailed"]["meta"][key] = value
+                meta[key] = value
 
-        self._storage.save_graph_ursaml(graph_id, ursaml_data)
-        
-        # Publish domain event
-        event_publisher.publish(MetricsRecorded(
-            event_id="",
-            timestamp=None,
-            aggregate_id=node_id,
-            graph_id=graph_id,
-            node_id=node_id,
-            metrics=metrics,
-        ))
-        
-        return metrics
+        with self._lock:
+            node_updates = self._pending.setdefault(graph_id, {})
+            if node_id not in node_updates:
+                node_updates[node_id] = {"meta": {}}
+                self._staged_count += 1
+            staged = node_updates[node_id]
+            if "accuracy" in metrics:
+                staged["score"] = metrics["accuracy"]
+            staged["meta"].update(meta)
+            self._dirty.add(graph_id)
+
+            flush_now = self._flush_interval <= 0 or self._staged_count >= self._buffer_size
+            if not flush_now:
+                self._schedule_flush()
+
+        if flush_now:
+            self.flush()
+
+    def _restage(self, graph_id: str, node_updates: Dict[str, Dict[str, Any]]) -> None:
+        """Put back a batch that failed to write, under anything staged since."""
+        with self._lock:
+            pending = self._pending.setdefault(graph_id, {})
+            for node_id, staged in node_updates.items():
+                newer = pending.get(node_id)
+                if newer is not None:
+                    staged["meta"].update(newer["meta"])
+                    if "score" in newer:
+                        staged["score"] = newer["score"]
+                pending[node_id] = staged
+            self._dirty.add(graph_id)
+            self._staged_count = sum(len(nodes) for nodes in self._pending.values())
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # Caller holds self._lock
+        if self._timer is None and self._flush_interval > 0:
+            self._timer = threading.Timer(self._flush_interval, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def _write_graph(self, graph_id: str, node_updates: Dict[str, Dict[str, Any]]) -> None:
+        # Same lock as node and edge writes: nothing can land between load and save
+        with self._storage.graph_write_lock(graph_id):
+            ursaml_data = self._storage.load_graph_ursaml(graph_id)
+            if not ursaml_data:
+                return
+
+            for node_id, staged in node_updates.items():
+                node = ursaml_data["nodes"].get(node_id)
+                if node is None:
+                    # Node deleted since the metrics were staged
+                    continue
+
+                # Update score column if present
+                if "score" in staged and "score" in node["columns"]:
+                    node["columns"]["score"] = staged["score"]
+
+                # Add metrics to detailed metadata
+                node["detailed"].setdefault("meta", {}).update(staged["meta"])
 
+            self._storage.save_graph_ursaml(graph_id, ursaml_data)
+        self._known_nodes[graph_id] = (time.monotonic(), frozenset(ursaml_data["nodes"]))
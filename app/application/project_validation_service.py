@@ -21,9 +21,6 @@ class ProjectValidationService:
 
     def check_duplicate_name(self, name: str, exclude_id: str | None = None) -> None:
         """Check if project name already exists."""
-        existing_projects = self._storage.get_all_projects()
-        for project in existing_projects:
-            if project["name"].lower() == name.lower():
-                if exclude_id is None or project["id"] != exclude_id:
-                    raise ConflictError(f"Project with name '{name}' already exists")
+        if self._storage.project_name_exists(name, exclude_id=exclude_id):
+            raise ConflictError(f"Project with name '{name}' already exists")
 
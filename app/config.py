@@ -1,4 +1,6 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import List
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
 # Get the repository root directory (parent of app directory)
@@ -16,19 +18,45 @@ class Settings(BaseSettings):
     VERSION: str = "0.1.0"
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+
+    # CORS: credentials are only allowed with explicit origins, so the
+    # wildcard default answers with a static "*" instead of echoing Origin
+    CORS_ORIGINS: List[str] = ["*"]
     
     # Storage settings
     STORAGE_TYPE: str = "filesystem"  # "filesystem" or "s3"
-    URSAML_STORAGE_DIR: str = str(REPO_ROOT / "storage" / "ursaml")
-    MODEL_STORAGE_DIR: str = str(REPO_ROOT / "storage" / "models")
+    URSAML_STORAGE_DIR: Path = REPO_ROOT / "storage" / "ursaml"
+    MODEL_STORAGE_DIR: Path = REPO_ROOT / "storage" / "models"
     
     # S3 settings (only used if STORAGE_TYPE = "s3")
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
     AWS_REGION: str = "us-east-1"
     S3_BUCKET: str = "ursa-models"
+    # HTTP connections kept by the shared S3 client (botocore's default is 10)
+    S3_MAX_POOL_CONNECTIONS: int = 50
+
+    # Audit log buffering
+    AUDIT_BUFFER_SIZE: int = 10_000
+    AUDIT_FLUSH_INTERVAL: float = 0.5
+
+    # Threads serving sync (blocking I/O) handlers; anyio's default is 40
+    THREADPOOL_WORKERS: int = 100
+
+    # Worker processes for model deserialization (0 = in the API process)
+    INGEST_WORKERS: int = 0
+
+    # Metrics write coalescing
+    METRICS_BUFFER_SIZE: int = 256
+    METRICS_FLUSH_INTERVAL: float = 1.0
     
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading .env only once."""
+    return Settings()
+
 
-settings = Settings() 
\ No newline at end of file
+settings = get_settings() 
\ No newline at end of file
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import atexit
+from functools import lru_cache
+
 import boto3
+from botocore.config import Config
 from app.config import settings, REPO_ROOT
-from pathlib import Path
 
 from app.services.cache.cache_manager import ModelCacheManager
 from app.services.cache.local_cache import LocalCacheRepository
@@ -19,8 +22,23 @@ from app.application.graph_validation_service import GraphValidationService
 from app.infrastructure.model_ingestion_adapter import ModelIngestionAdapter
 
 
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    # One client per process so its connection pool is reused across requests;
+    # the pool is sized for the handler threadpool so concurrent transfers
+    # don't keep discarding and reopening connections
+    return boto3.client(
+        's3',
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        config=Config(max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS, tcp_keepalive=True),
+    )
+
+
+@lru_cache(maxsize=1)
 def get_cache_manager() -> ModelCacheManager:
-    cache_root = Path(settings.MODEL_STORAGE_DIR) / "cache"
+    cache_root = settings.MODEL_STORAGE_DIR / "cache"
     cache_root.mkdir(parents=True, exist_ok=True)
 
     metadata_store = CacheMetadataStore(cache_root / "cache_metadata.json")
@@ -29,13 +47,7 @@ def get_cache_manager() -> ModelCacheManager:
 
     s3_enabled = settings.STORAGE_TYPE == "s3"
     if s3_enabled:
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
-        )
-        gateway = ModelS3Gateway(s3_client, settings.S3_BUCKET)
+        gateway = ModelS3Gateway(_get_s3_client(), settings.S3_BUCKET)
     else:
         gateway = NullModelS3Gateway()
 
@@ -50,30 +62,50 @@ def get_cache_manager() -> ModelCacheManager:
     )
 
 
+@lru_cache(maxsize=1)
 def get_ursaml_storage() -> UrsaMLStorage:
-    return UrsaMLStorage(base_path=str(settings.URSAML_STORAGE_DIR))
+    return UrsaMLStorage(base_path=settings.URSAML_STORAGE_DIR)
 
 
+@lru_cache(maxsize=1)
+def get_model_ingestion_adapter() -> ModelIngestionAdapter:
+    # Built once so its UrsaClient is not reconstructed for every upload
+    return ModelIngestionAdapter(
+        sdk_dir=settings.MODEL_STORAGE_DIR, framework="pickle", workers=settings.INGEST_WORKERS
+    )
+
+
+@lru_cache(maxsize=1)
 def get_model_app_service() -> ModelAppService:
-    sdk_dir = Path(settings.MODEL_STORAGE_DIR)
     return ModelAppService(
         storage=get_ursaml_storage(),
         cache=get_cache_manager(),
-        ingestion=ModelIngestionAdapter(sdk_dir=sdk_dir, framework="pickle"),
+        ingestion=get_model_ingestion_adapter(),
     )
 
 
+@lru_cache(maxsize=1)
 def get_graph_access_service() -> GraphAccessService:
     return GraphAccessService(storage=get_ursaml_storage())
 
 
+@lru_cache(maxsize=1)
 def get_metrics_service() -> MetricsService:
-    return MetricsService(storage=get_ursaml_storage())
+    # Shared across requests so staged metric writes coalesce
+    service = MetricsService(
+        storage=get_ursaml_storage(),
+        buffer_size=settings.METRICS_BUFFER_SIZE,
+        flush_interval=settings.METRICS_FLUSH_INTERVAL,
+    )
+    atexit.register(service.flush)
+    return service
 
 
+@lru_cache(maxsize=1)
 def get_project_validation_service() -> ProjectValidationService:
     return ProjectValidationService(storage=get_ursaml_storage())
 
 
+@lru_cache(maxsize=1)
 def get_graph_validation_service() -> GraphValidationService:
     return GraphValidationService(storage=get_ursaml_storage())
@@ -1,40 +1,44 @@
 """Domain events for decoupled side effects and integrations."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List
-from uuid import uuid4
+from typing import Any, Callable, Deque, Dict, Iterable, Mapping, Tuple
 
+from app.domain.ids import new_id
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class DomainEvent:
-    """Base class for all domain events."""
-    event_id: str
-    timestamp: datetime
+    """Base class for all domain events.
+
+    ``event_id`` and ``timestamp`` are keyword-only with generated defaults,
+    so subclasses can still declare required fields after them.
+    """
     aggregate_id: str
-    
-    def __post_init__(self):
-        if not hasattr(self, 'event_id') or not self.event_id:
-            object.__setattr__(self, 'event_id', str(uuid4()))
-        if not hasattr(self, 'timestamp') or not self.timestamp:
-            object.__setattr__(self, 'timestamp', datetime.now())
+    event_id: str = field(default_factory=new_id, kw_only=True)
+    timestamp: datetime = field(default_factory=datetime.now, kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectCreated(DomainEvent):
     """Raised when a new project is created."""
     name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectDeleted(DomainEvent):
     """Raised when a project is deleted."""
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphCreated(DomainEvent):
     """Raised when a new graph is created."""
     project_id: str
@@ -42,14 +46,14 @@ class GraphCreated(DomainEvent):
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphDeleted(DomainEvent):
     """Raised when a graph is deleted."""
     project_id: str
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelUploaded(DomainEvent):
     """Raised when a model is uploaded."""
     model_id: str
@@ -59,52 +63,140 @@ class ModelUploaded(DomainEvent):
     framework: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelDeleted(DomainEvent):
     """Raised when a model is deleted."""
     model_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsRecorded(DomainEvent):
     """Raised when metrics are recorded for a node."""
     graph_id: str
     node_id: str
     metrics: Dict[str, Any]
 
+    @classmethod
+    def for_node(cls, graph_id: str, node_id: str, metrics: Dict[str, Any]) -> MetricsRecorded:
+        """Build the event for a node with a fresh id and timestamp."""
+        return cls(
+            aggregate_id=node_id,
+            graph_id=graph_id,
+            node_id=node_id,
+            metrics=metrics,
+        )
+
+
+def _report_handler_error(exc: Exception) -> None:
+    # Log error but don't fail the main operation
+    logger.error("Event handler error", exc_info=exc)
+
+
+def _build_dispatch(handlers: Tuple[Callable[[DomainEvent], None], ...]) -> Callable[[DomainEvent], None]:
+    """Generate one function that calls every handler inline, each isolated by try/except."""
+    lines = ["def dispatch(e):"]
+    for i in range(len(handlers)):
+        lines += [
+            "    try:",
+            f"        h{i}(e)",
+            "    except Exception as exc:",
+            "        report(exc)",
+        ]
+    if not handlers:
+        lines.append("    pass")
+    namespace: Dict[str, Any] = {f"h{i}": h for i, h in enumerate(handlers)}
+    namespace["report"] = _report_handler_error
+    exec("\n".join(lines), namespace)
+    return namespace["dispatch"]
+
 
 class DomainEventPublisher:
-    """Singleton publisher for domain events."""
+    """Singleton publisher for domain events.
+
+    Events published from within a handler are queued and dispatched by the
+    outermost ``publish`` call once the current event has been delivered,
+    so nested publishes never re-enter the dispatch loop. The queue is per
+    thread: concurrent requests each dispatch their own events, on their
+    own thread, before ``publish`` returns.
+
+    Handlers subscribed to a base class also receive its subclasses'
+    events, most specific type first. Each concrete event type's handler
+    chain is resolved along its MRO once and compiled into a single
+    dispatch function on first use (or eagerly via ``compile``); the tables
+    are rebuilt after any subscription change.
+    """
     
     _instance: DomainEventPublisher | None = None
-    _subscribers: Dict[type, List[Callable[[DomainEvent], None]]]
+    _subscribers: Dict[type, Tuple[Callable[[DomainEvent], None], ...]]
+    _compiled: Dict[type, Callable[[DomainEvent], None]]
+    # ``queue`` attribute: the calling thread's pending events while it
+    # is dispatching, None otherwise
+    _local: threading.local
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._subscribers = {}
+            cls._instance._compiled = {}
+            cls._instance._local = threading.local()
         return cls._instance
     
     def subscribe(self, event_type: type[DomainEvent], handler: Callable[[DomainEvent], None]) -> None:
         """Subscribe a handler to an event type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (handler,)
+        # Subclasses inherit this chain, so every resolved table may be stale
+        self._compiled = {}
+
+    def bulk_subscribe(
+        self, mapping: Mapping[type[DomainEvent], Iterable[Callable[[DomainEvent], None]]]
+    ) -> None:
+        """Subscribe many handlers at once, freezing each chain into a tuple."""
+        for event_type, handlers in mapping.items():
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + tuple(handlers)
+        self._compiled = {}
+
+    def compile(self) -> None:
+        """Build the dispatch function for every subscribed event type up front."""
+        for event_type in self._subscribers:
+            self._dispatcher_for(event_type)
+
+    def _resolve(self, event_type: type) -> Tuple[Callable[[DomainEvent], None], ...]:
+        """Concatenate the handler chains along ``event_type``'s MRO."""
+        handlers: Tuple[Callable[[DomainEvent], None], ...] = ()
+        for klass in event_type.__mro__:
+            handlers += self._subscribers.get(klass, ())
+        return handlers
+
+    def _dispatcher_for(self, event_type: type) -> Callable[[DomainEvent], None]:
+        dispatch = self._compiled.get(event_type)
+        if dispatch is None:
+            dispatch = _build_dispatch(self._resolve(event_type))
+            self._compiled[event_type] = dispatch
+        return dispatch
     
     def publish(self, event: DomainEvent) -> None:
         """Publish an event to all subscribers."""
-        event_type = type(event)
-        if event_type in self._subscribers:
-            for handler in self._subscribers[event_type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    # Log error but don't fail the main operation
-                    print(f"Event handler error: {e}")
+        local = self._local
+        queue: Deque[DomainEvent] | None = getattr(local, "queue", None)
+        if queue is not None:
+            # Drained by the outer publish call on this thread
+            queue.append(event)
+            return
+        local.queue = queue = deque((event,))
+        try:
+            while queue:
+                current = queue.popleft()
+                self._dispatcher_for(type(current))(current)
+        finally:
+            local.queue = None
     
     def clear_subscribers(self) -> None:
         """Clear all subscribers (useful for testing)."""
         self._subscribers = {}
+        self._compiled = {}
+        queue = getattr(self._local, "queue", None)
+        if queue is not None:
+            queue.clear()
 
 
 # Singleton instance
@@ -0,0 +1,75 @@
+"""Identifier generation for domain objects."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+_ID_BYTES = 16
+# Random bytes fetched per os.urandom call (256 ids)
+_REFILL_BYTES = 4096
+
+_buf = bytearray()
+_lock = threading.Lock()
+
+# Millisecond and in-millisecond sequence of the last ordered id
+_last_ms = 0
+_seq = 0
+_SEQ_MAX = 0xFFF
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def _reset_buffer() -> None:
+    # A forked child must not hand out the parent's remaining ids
+    global _buf, _lock
+    _buf = bytearray()
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_buffer)
+
+
+def _take_random(count: int) -> bytes:
+    # Caller holds _lock
+    global _buf
+    if len(_buf) < count:
+        _buf = bytearray(os.urandom(_REFILL_BYTES))
+    raw = bytes(_buf[-count:])
+    del _buf[-count:]
+    return raw
+
+
+def new_id() -> str:
+    """Return a random (version 4) UUID string.
+
+    Random bytes are drawn from a buffer refilled in bulk, amortizing the
+    urandom syscall over many ids.
+    """
+    with _lock:
+        raw = _take_random(_ID_BYTES)
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+def new_ordered_id() -> str:
+    """Return a time-ordered (version 7) UUID string.
+
+    Ids lead with the Unix time in milliseconds, then a 12-bit sequence
+    that keeps ids minted in the same millisecond in creation order, so
+    ids sort (and index) by creation time.
+    """
+    global _last_ms, _seq
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms, _seq = ms, 0
+        elif _seq < _SEQ_MAX:
+            _seq += 1
+        else:
+            # Sequence exhausted (or the clock stepped back): borrow the next millisecond
+            _last_ms, _seq = _last_ms + 1, 0
+        ms, seq = _last_ms, _seq
+        rand_b = int.from_bytes(_take_random(8), "big") & _RAND_B_MASK
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+    return str(uuid.UUID(int=value))
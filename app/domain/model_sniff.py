@@ -0,0 +1,40 @@
+"""Cheap framework detection from the leading bytes of a serialized model."""
+from __future__ import annotations
+
+from typing import Optional
+
+from app.domain.strategies import OOB_PICKLE_MAGIC, ModelBytes
+
+_PICKLE_PROTO = 0x80
+_ZIP_MAGIC = b"PK\x03\x04"
+_GZIP_MAGIC = b"\x1f\x8b"
+# POSIX tar headers carry "ustar" at byte 257
+_TAR_MAGIC = b"ustar"
+_TAR_MAGIC_OFFSET = 257
+
+# Leading bytes callers must supply for every check to apply
+SNIFF_HEADER_BYTES = 512
+
+
+def sniff_framework(data: ModelBytes) -> Optional[str]:
+    """Guess the serialization framework from the payload header.
+
+    Only looks at the header bytes, so it is O(1) in the model size.
+    Returns a key understood by ``SerializationStrategyFactory`` or None
+    when the format is not recognised.
+    """
+    head = data[:4]
+    if len(head) >= 2 and head[0] == _PICKLE_PROTO and 2 <= head[1] <= 5:
+        return "pickle"
+    if head == OOB_PICKLE_MAGIC:
+        # Framed pickle with out-of-band buffers
+        return "pickle"
+    if head == _ZIP_MAGIC:
+        # torch.save writes a zip archive since PyTorch 1.6
+        return "pytorch"
+    if head[:2] == _GZIP_MAGIC:
+        # TensorFlowSerializationStrategy ships models as tar or tar.gz
+        return "tensorflow"
+    if data[_TAR_MAGIC_OFFSET:_TAR_MAGIC_OFFSET + len(_TAR_MAGIC)] == _TAR_MAGIC:
+        return "tensorflow"
+    return None
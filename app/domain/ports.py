@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, TYPE_CHECKING
+from typing import Any, ContextManager, Dict, List, Optional, Protocol, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.domain.specifications import Specification
@@ -24,6 +24,8 @@ class StoragePort(Protocol):
 
     def delete_project(self, project_id: str) -> bool: ...
 
+    def project_name_exists(self, name: str, exclude_id: str | None = None) -> bool: ...
+
     # Graph operations
     def create_graph(
         self, project_id: str, name: str, description: str = ""
@@ -39,6 +41,12 @@ class StoragePort(Protocol):
 
     def delete_graph(self, graph_id: str) -> bool: ...
 
+    def graph_name_exists(
+        self, project_id: str, name: str, exclude_id: str | None = None
+    ) -> bool: ...
+
+    def get_project_graphs_json(self, project_id: str) -> bytes: ...
+
     # Node operations
     def create_node(
         self, graph_id: str, name: str, model_id: str | None = None
@@ -48,6 +56,8 @@ class StoragePort(Protocol):
 
     def get_graph_nodes(self, graph_id: str) -> List[Dict[str, Any]]: ...
 
+    def get_graph_metrics(self, graph_id: str) -> Dict[str, Dict[str, Any]]: ...
+
     def update_node(
         self, graph_id: str, node_id: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]: ...
@@ -56,11 +66,17 @@ class StoragePort(Protocol):
 
     def get_graph_edges(self, graph_id: str) -> List[Dict[str, Any]]: ...
 
+    def get_graph_structure(
+        self, graph_id: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: ...
+
     # UrsaML format operations
     def load_graph_ursaml(self, graph_id: str) -> Optional[Dict[str, Any]]: ...
 
     def save_graph_ursaml(self, graph_id: str, ursaml_data: Dict[str, Any]) -> None: ...
 
+    def graph_write_lock(self, graph_id: str) -> ContextManager[Any]: ...
+
     # Health check operations
     def get_storage_stats(self) -> Dict[str, Any]: ...
 
@@ -75,10 +91,16 @@ class StoragePort(Protocol):
 class CachePort(Protocol):
     """Abstract cache interface for model persistence and retrieval."""
 
-    def save_model_from_sdk(self, model_id: str, sdk_dir: Path) -> Path: ...
+    def save_model_from_sdk(self, model_id: str, sdk_dir: Path, move: bool = False) -> Path: ...
 
     def get_model_for_sdk(self, model_id: str, force_refresh: bool = False) -> Path: ...
 
+    def release_sdk_workspace(self, workspace: Path) -> None: ...
+
+    def resolve_model_file(self, model_id: str) -> Tuple[Path, Dict[str, Any]]: ...
+
+    def get_metadata(self, model_id: str) -> Dict[str, Any]: ...
+
     def delete_model(self, model_id: str) -> bool: ...
 
     # Health check operations
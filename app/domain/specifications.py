@@ -2,16 +2,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
+
+Predicate = Callable[[Dict[str, Any]], bool]
 
 
 class Specification(ABC):
     """Abstract base for specifications (query filters)."""
+
+    __slots__ = ()
     
     @abstractmethod
     def is_satisfied_by(self, candidate: Dict[str, Any]) -> bool:
         """Check if candidate satisfies this specification."""
         pass
+
+    def compile(self) -> Predicate:
+        """Return a plain predicate equivalent to ``is_satisfied_by``."""
+        return self.is_satisfied_by
     
     def and_(self, other: Specification) -> Specification:
         """Combine with AND logic."""
@@ -28,6 +36,8 @@ class Specification(ABC):
 
 class AndSpecification(Specification):
     """AND composite specification."""
+
+    __slots__ = ("left", "right")
     
     def __init__(self, left: Specification, right: Specification):
         self.left = left
@@ -36,9 +46,24 @@ class AndSpecification(Specification):
     def is_satisfied_by(self, candidate: Dict[str, Any]) -> bool:
         return self.left.is_satisfied_by(candidate) and self.right.is_satisfied_by(candidate)
 
+    def compile(self) -> Predicate:
+        preds = [_compile(s) for s in _flatten(self, AndSpecification)]
+        if len(preds) == 2:
+            left, right = preds
+            return lambda c: left(c) and right(c)
+
+        def all_of(c: Dict[str, Any]) -> bool:
+            for pred in preds:
+                if not pred(c):
+                    return False
+            return True
+        return all_of
+
 
 class OrSpecification(Specification):
     """OR composite specification."""
+
+    __slots__ = ("left", "right")
     
     def __init__(self, left: Specification, right: Specification):
         self.left = left
@@ -47,9 +72,24 @@ class OrSpecification(Specification):
     def is_satisfied_by(self, candidate: Dict[str, Any]) -> bool:
         return self.left.is_satisfied_by(candidate) or self.right.is_satisfied_by(candidate)
 
+    def compile(self) -> Predicate:
+        preds = [_compile(s) for s in _flatten(self, OrSpecification)]
+        if len(preds) == 2:
+            left, right = preds
+            return lambda c: left(c) or right(c)
+
+        def any_of(c: Dict[str, Any]) -> bool:
+            for pred in preds:
+                if pred(c):
+                    return True
+            return False
+        return any_of
+
 
 class NotSpecification(Specification):
     """NOT specification."""
+
+    __slots__ = ("spec",)
     
     def __init__(self, spec: Specification):
         self.spec = spec
@@ -57,11 +97,49 @@ class NotSpecification(Specification):
     def is_satisfied_by(self, candidate: Dict[str, Any]) -> bool:
         return not self.spec.is_satisfied_by(candidate)
 
+    def compile(self) -> Predicate:
+        pred = _compile(self.spec)
+        return lambda c: not pred(c)
+
+
+def _always(candidate: Dict[str, Any]) -> bool:
+    return True
+
+
+def _contains_lower(key: str, pattern: str) -> Predicate:
+    """Predicate for a case-insensitive substring match on ``candidate[key]``."""
+    if not pattern:
+        # Every string contains "": skip lowering the field entirely
+        return _always
+    return lambda c: pattern in c.get(key, "").lower()
+
+
+def _compile(spec: Any) -> Predicate:
+    # Duck-typed specifications without compile() fall back to is_satisfied_by
+    compile_ = getattr(spec, "compile", None)
+    return compile_() if compile_ is not None else spec.is_satisfied_by
+
+
+def _flatten(spec: Any, kind: type) -> List[Any]:
+    """Collect the operands of a left/right-nested chain of ``kind`` composites."""
+    operands: List[Any] = []
+    stack = [spec]
+    while stack:
+        current = stack.pop()
+        if type(current) is kind:
+            stack.append(current.right)
+            stack.append(current.left)
+        else:
+            operands.append(current)
+    return operands
+
 
 # Project Specifications
 
 class ProjectByName(Specification):
     """Finds projects by name (case-insensitive contains)."""
+
+    __slots__ = ("pattern",)
     
     def __init__(self, name_pattern: str):
         self.pattern = name_pattern.lower()
@@ -69,9 +147,14 @@ class ProjectByName(Specification):
     def is_satisfied_by(self, project: Dict[str, Any]) -> bool:
         return self.pattern in project.get("name", "").lower()
 
+    def compile(self) -> Predicate:
+        return _contains_lower("name", self.pattern)
+
 
 class ProjectByDescription(Specification):
     """Finds projects by description keyword."""
+
+    __slots__ = ("keyword",)
     
     def __init__(self, keyword: str):
         self.keyword = keyword.lower()
@@ -79,9 +162,14 @@ class ProjectByDescription(Specification):
     def is_satisfied_by(self, project: Dict[str, Any]) -> bool:
         return self.keyword in project.get("description", "").lower()
 
+    def compile(self) -> Predicate:
+        return _contains_lower("description", self.keyword)
+
 
 class ProjectHasGraphs(Specification):
     """Projects that have at least one graph."""
+
+    __slots__ = ("get_graphs",)
     
     def __init__(self, storage_graphs_getter):
         """
@@ -99,6 +187,8 @@ class ProjectHasGraphs(Specification):
 
 class GraphByName(Specification):
     """Finds graphs by name (case-insensitive contains)."""
+
+    __slots__ = ("pattern",)
     
     def __init__(self, name_pattern: str):
         self.pattern = name_pattern.lower()
@@ -106,9 +196,14 @@ class GraphByName(Specification):
     def is_satisfied_by(self, graph: Dict[str, Any]) -> bool:
         return self.pattern in graph.get("name", "").lower()
 
+    def compile(self) -> Predicate:
+        return _contains_lower("name", self.pattern)
+
 
 class GraphInProject(Specification):
     """Graphs belonging to a specific project."""
+
+    __slots__ = ("project_id",)
     
     def __init__(self, project_id: str):
         self.project_id = project_id
@@ -119,6 +214,8 @@ class GraphInProject(Specification):
 
 class GraphHasNodes(Specification):
     """Graphs that have at least one node."""
+
+    __slots__ = ("get_nodes",)
     
     def __init__(self, storage_nodes_getter):
         """
@@ -136,6 +233,8 @@ class GraphHasNodes(Specification):
 
 class NodeWithModel(Specification):
     """Nodes that have an associated model."""
+
+    __slots__ = ()
     
     def is_satisfied_by(self, node: Dict[str, Any]) -> bool:
         model_id = node.get("model_id")
@@ -144,6 +243,8 @@ class NodeWithModel(Specification):
 
 class NodeHasMetrics(Specification):
     """Nodes that have recorded metrics."""
+
+    __slots__ = ()
     
     def is_satisfied_by(self, node: Dict[str, Any]) -> bool:
         metadata = node.get("metadata", {})
@@ -153,6 +254,8 @@ class NodeHasMetrics(Specification):
 
 class NodeInGraph(Specification):
     """Nodes belonging to a specific graph."""
+
+    __slots__ = ("graph_id",)
     
     def __init__(self, graph_id: str):
         self.graph_id = graph_id
@@ -165,5 +268,5 @@ class NodeInGraph(Specification):
 
 def filter_by_specification(items: List[Dict[str, Any]], spec: Specification) -> List[Dict[str, Any]]:
     """Filter a collection using a specification."""
-    return [item for item in items if spec.is_satisfied_by(item)]
-
+    pred = _compile(spec)
+    return [item for item in items if pred(item)]
@@ -2,18 +2,40 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Protocol
+from typing import Any, BinaryIO, Dict, List, Protocol, Union
+import io
 import pickle
+import struct
+import weakref
+
+# Serialized payloads; any buffer is accepted so callers holding a
+# bytearray or memoryview need not copy it into bytes first.
+ModelBytes = Union[bytes, bytearray, memoryview]
+
+# Protocol 5 (PEP 574) frames large buffers such as numpy arrays without
+# intermediate copies; readable by any Python >= 3.8.
+PICKLE_PROTOCOL = 5
+
+# Framed payload: magic, buffer count, then the pickle stream's length and
+# each out-of-band buffer's length, followed by the stream and the buffers.
+OOB_PICKLE_MAGIC = b"\x93UPB"
+_OOB_COUNT = struct.Struct("<I")
+_OOB_LENGTH = struct.Struct("<Q")
 
 
 class ModelSerializationStrategy(Protocol):
-    """Protocol for model serialization strategies."""
+    """Protocol for model serialization strategies.
+
+    Strategies may also offer ``load(stream)`` to deserialize straight from
+    a seekable binary file object; callers fall back to ``deserialize``
+    otherwise.
+    """
     
     def serialize(self, model: Any) -> bytes:
         """Serialize a model to bytes."""
         ...
     
-    def deserialize(self, data: bytes) -> Any:
+    def deserialize(self, data: ModelBytes) -> Any:
         """Deserialize bytes to a model."""
         ...
     
@@ -23,18 +45,74 @@ class ModelSerializationStrategy(Protocol):
 
 
 class PickleSerializationStrategy:
-    """Pickle-based serialization (default for scikit-learn)."""
+    """Pickle-based serialization (default for scikit-learn).
+
+    With ``out_of_band=True`` large contiguous buffers (e.g. numpy arrays)
+    are written after the pickle stream instead of inside it, and
+    ``deserialize`` rebuilds them as views over the payload rather than
+    copies. Such views are read-only when the payload is ``bytes``.
+    The default output stays a plain pickle so external clients can
+    ``pickle.loads`` it; ``deserialize`` accepts both forms.
+    """
+
+    def __init__(self, out_of_band: bool = False):
+        self.out_of_band = out_of_band
     
     def serialize(self, model: Any) -> bytes:
-        return pickle.dumps(model)
+        if not self.out_of_band:
+            return pickle.dumps(model, protocol=PICKLE_PROTOCOL)
+        buffers: List[pickle.PickleBuffer] = []
+        stream = pickle.dumps(model, protocol=PICKLE_PROTOCOL, buffer_callback=buffers.append)
+        raws = [buffer.raw() for buffer in buffers]
+        header = [OOB_PICKLE_MAGIC, _OOB_COUNT.pack(len(raws)), _OOB_LENGTH.pack(len(stream))]
+        header += [_OOB_LENGTH.pack(raw.nbytes) for raw in raws]
+        return b"".join([*header, stream, *raws])
     
-    def deserialize(self, data: bytes) -> Any:
-        return pickle.loads(data)
+    def deserialize(self, data: ModelBytes) -> Any:
+        if data[:len(OOB_PICKLE_MAGIC)] != OOB_PICKLE_MAGIC:
+            return pickle.loads(data)
+        view = memoryview(data)
+        offset = len(OOB_PICKLE_MAGIC)
+        (count,) = _OOB_COUNT.unpack_from(view, offset)
+        offset += _OOB_COUNT.size
+        lengths = [
+            _OOB_LENGTH.unpack_from(view, offset + i * _OOB_LENGTH.size)[0]
+            for i in range(count + 1)
+        ]
+        offset += (count + 1) * _OOB_LENGTH.size
+        slices = []
+        for length in lengths:
+            slices.append(view[offset:offset + length])
+            offset += length
+        stream, buffers = slices[0], slices[1:]
+        return pickle.loads(stream, buffers=buffers)
+
+    def load(self, stream: BinaryIO) -> Any:
+        """Unpickle directly from a seekable binary stream."""
+        head = stream.read(len(OOB_PICKLE_MAGIC))
+        if head == OOB_PICKLE_MAGIC:
+            # Framed payloads need the whole buffer for zero-copy views
+            return self.deserialize(head + stream.read())
+        stream.seek(-len(head), io.SEEK_CUR)
+        return pickle.load(stream)
     
     def get_framework_name(self) -> str:
         return "sklearn"
 
 
+class NumpyAwarePickleStrategy(PickleSerializationStrategy):
+    """Pickle for array-heavy estimators, with array data framed out-of-band.
+
+    numpy arrays hand their data to protocol 5 as ``PickleBuffer``s, so the
+    pickled shell holds only the Python scaffolding while the raw array
+    bytes follow it contiguously; loading rebuilds each array as a view
+    over the payload instead of a copy.
+    """
+
+    def __init__(self):
+        super().__init__(out_of_band=True)
+
+
 class TorchSerializationStrategy:
     """PyTorch model serialization."""
     
@@ -48,21 +126,54 @@ class TorchSerializationStrategy:
         except ImportError:
             raise RuntimeError("PyTorch not installed")
     
-    def deserialize(self, data: bytes) -> Any:
+    def deserialize(self, data: ModelBytes) -> Any:
         try:
             import torch
             import io
-            buffer = io.BytesIO(data)
-            return torch.load(buffer)
+            import os
+            import tempfile
         except ImportError:
             raise RuntimeError("PyTorch not installed")
+
+        # Stage the bytes in a file so tensor storages can be mmapped and
+        # paged in on demand rather than materialized up front. The mapping
+        # outlives the unlink, so the file is removed straight after loading.
+        fd, path = tempfile.mkstemp(suffix=".pt")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            try:
+                # Load onto CPU so GPU-saved models don't allocate device memory
+                return torch.load(path, map_location="cpu", mmap=True)
+            except (RuntimeError, TypeError):
+                # Legacy (non-zip) checkpoints and older torch lack mmap
+                # support; read the scratch file rather than copying data
+                return torch.load(path, map_location="cpu")
+        finally:
+            os.unlink(path)
+
+    def load(self, stream: BinaryIO) -> Any:
+        """Load a model directly from a seekable binary stream."""
+        try:
+            import torch
+        except ImportError:
+            raise RuntimeError("PyTorch not installed")
+        return torch.load(stream, map_location="cpu")
     
     def get_framework_name(self) -> str:
         return "pytorch"
 
 
 class TensorFlowSerializationStrategy:
-    """TensorFlow/Keras model serialization."""
+    """TensorFlow/Keras model serialization.
+
+    SavedModels are shipped as an uncompressed tar by default; gzip is
+    single-threaded and dominates serialize time for large models. Pass
+    ``compress=True`` for a tar.gz. ``deserialize`` accepts either.
+    """
+
+    def __init__(self, compress: bool = False):
+        self.compress = compress
     
     def serialize(self, model: Any) -> bytes:
         try:
@@ -80,24 +191,27 @@ class TensorFlowSerializationStrategy:
                 import tarfile
                 import io
                 buffer = io.BytesIO()
-                with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+                mode = 'w:gz' if self.compress else 'w'
+                with tarfile.open(fileobj=buffer, mode=mode, format=tarfile.PAX_FORMAT) as tar:
                     tar.add(model_path, arcname='model')
                 return buffer.getvalue()
         except ImportError:
             raise RuntimeError("TensorFlow not installed")
     
-    def deserialize(self, data: bytes) -> Any:
+    def deserialize(self, data: ModelBytes) -> Any:
+        return self.load(io.BytesIO(data))
+
+    def load(self, stream: BinaryIO) -> Any:
+        """Extract and load a SavedModel archive from a binary stream."""
         try:
             import tensorflow as tf
             import tempfile
             import tarfile
-            import io
             from pathlib import Path
             
-            # Extract from tar archive
+            # Extract from tar archive, streaming and detecting compression
             with tempfile.TemporaryDirectory() as tmpdir:
-                buffer = io.BytesIO(data)
-                with tarfile.open(fileobj=buffer, mode='r:gz') as tar:
+                with tarfile.open(fileobj=stream, mode='r|*') as tar:
                     tar.extractall(tmpdir)
                 
                 model_path = Path(tmpdir) / "model"
@@ -119,11 +233,14 @@ class ONNXSerializationStrategy:
         except ImportError:
             raise RuntimeError("ONNX not installed")
     
-    def deserialize(self, data: bytes) -> Any:
+    def deserialize(self, data: ModelBytes) -> Any:
         try:
             import onnx
             model = onnx.ModelProto()
-            model.ParseFromString(data)
+            # Parse through a buffer view: bytearray/memoryview payloads
+            # (e.g. chunk-decoded uploads) are read in place, not copied
+            with memoryview(data) as view:
+                model.ParseFromString(view)
             return model
         except ImportError:
             raise RuntimeError("ONNX not installed")
@@ -133,43 +250,60 @@ class ONNXSerializationStrategy:
 
 
 class SerializationStrategyFactory:
-    """Factory to select serialization strategy based on framework."""
+    """Factory to select serialization strategy based on framework.
+
+    Strategies are stateless in their default configuration, so one shared
+    instance per strategy class is handed out.
+    """
     
     _strategies = {
         "sklearn": PickleSerializationStrategy,
         "scikit-learn": PickleSerializationStrategy,
         "pickle": PickleSerializationStrategy,
+        "sklearn-numpy": NumpyAwarePickleStrategy,
+        "numpy": NumpyAwarePickleStrategy,
         "pytorch": TorchSerializationStrategy,
         "torch": TorchSerializationStrategy,
         "tensorflow": TensorFlowSerializationStrategy,
         "keras": TensorFlowSerializationStrategy,
         "onnx": ONNXSerializationStrategy,
     }
+    _instances: Dict[type, ModelSerializationStrategy] = {}
+
+    # Module-name markers checked in order by detect_framework
+    _framework_markers = (
+        ("sklearn", "sklearn"),
+        ("scikit", "sklearn"),
+        ("torch", "pytorch"),
+        ("tensorflow", "tensorflow"),
+        ("keras", "tensorflow"),
+        ("onnx", "onnx"),
+    )
+    _detected: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
     
     @classmethod
     def get_strategy(cls, framework: str) -> ModelSerializationStrategy:
         """Get serialization strategy for a framework."""
-        strategy_class = cls._strategies.get(framework.lower())
-        if strategy_class is None:
-            # Default to pickle for unknown frameworks
-            return PickleSerializationStrategy()
-        return strategy_class()
+        # Default to pickle for unknown (or missing) frameworks
+        strategy_class = cls._strategies.get((framework or "").lower(), PickleSerializationStrategy)
+        strategy = cls._instances.get(strategy_class)
+        if strategy is None:
+            strategy = cls._instances[strategy_class] = strategy_class()
+        return strategy
     
     @classmethod
     def detect_framework(cls, model: Any) -> str:
         """Attempt to detect framework from model type."""
-        model_type = type(model).__module__
-        
-        if "sklearn" in model_type or "scikit" in model_type:
-            return "sklearn"
-        elif "torch" in model_type:
-            return "pytorch"
-        elif "tensorflow" in model_type or "keras" in model_type:
-            return "tensorflow"
-        elif "onnx" in model_type:
-            return "onnx"
-        else:
-            return "unknown"
+        model_class = type(model)
+        framework = cls._detected.get(model_class)
+        if framework is None:
+            model_type = model_class.__module__
+            framework = next(
+                (name for marker, name in cls._framework_markers if marker in model_type),
+                "unknown",
+            )
+            cls._detected[model_class] = framework
+        return framework
     
     @classmethod
     def register_strategy(cls, framework: str, strategy_class: type) -> None:
@@ -1,15 +1,56 @@
 """Adapter handling SDK layout preparation using UrsaClient."""
 from __future__ import annotations
 
-import base64
+import binascii
+import functools
+import multiprocessing
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, BinaryIO, Dict, NamedTuple, Optional
 
 from ursakit.client import UrsaClient
 
+try:  # SIMD-accelerated codec when available
+    import pybase64 as _b64
+    _decode_strict = functools.partial(_b64.b64decode, validate=True)
+except ImportError:  # pragma: no cover - fallback to stdlib
+    import base64 as _b64
+    # Straight to the C decoder: b64decode would first re-encode str input
+    _decode_strict = functools.partial(binascii.a2b_base64, strict_mode=True)
+
 from app.domain.errors import ValidationError
-from app.domain.strategies import SerializationStrategyFactory
+from app.domain.model_sniff import SNIFF_HEADER_BYTES, sniff_framework
+from app.domain.strategies import ModelBytes, ModelSerializationStrategy, SerializationStrategyFactory
+
+# Base64 characters decoded per step (multiple of 4, ~768 KiB of output)
+B64_CHUNK_CHARS = 1024 * 1024
+
+# Decoded uploads up to this size stay in memory; larger ones spill to disk
+DECODE_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+# Read size when staging a stream to a file for a worker process
+STAGE_COPY_BYTES = 1024 * 1024
+
+
+def _decode_b64_into(file_b64: str, out: BinaryIO) -> None:
+    """Decode base64 text chunk by chunk into a writable binary file.
+
+    Only one chunk of decoded output is held at a time; payloads that are
+    not canonical base64 are rewritten from the lenient one-shot decode.
+    """
+    if len(file_b64) % 4 == 0:
+        try:
+            for start in range(0, len(file_b64), B64_CHUNK_CHARS):
+                out.write(_decode_strict(file_b64[start:start + B64_CHUNK_CHARS]))
+            return
+        except (binascii.Error, ValueError):
+            out.seek(0)
+            out.truncate()
+    out.write(_b64.b64decode(file_b64.encode("ascii"), validate=False))
 
 
 class ModelIngestionResult(NamedTuple):
@@ -22,21 +63,78 @@ class ModelIngestionResult(NamedTuple):
     framework: str
 
 
+# Per-worker adapters, keyed by SDK directory (worker processes only)
+_worker_adapters: Dict[Path, ModelIngestionAdapter] = {}
+
+
+def _worker_adapter(sdk_dir: Path, default_framework: str) -> ModelIngestionAdapter:
+    adapter = _worker_adapters.get(sdk_dir)
+    if adapter is None:
+        adapter = _worker_adapters[sdk_dir] = ModelIngestionAdapter(sdk_dir, default_framework)
+    return adapter
+
+
+def _prepare_in_worker(
+    sdk_dir: Path, default_framework: str, model_bytes: ModelBytes, framework: str | None
+) -> ModelIngestionResult:
+    return _worker_adapter(sdk_dir, default_framework).prepare_bytes(model_bytes, framework)
+
+
+def _prepare_file_in_worker(
+    sdk_dir: Path, default_framework: str, path: str, framework: str | None
+) -> ModelIngestionResult:
+    with open(path, "rb") as stream:
+        return _worker_adapter(sdk_dir, default_framework).prepare_stream(stream, framework)
+
+
 class ModelIngestionAdapter:
-    """Prepares model artifacts using UrsaSDK with pluggable serialization."""
+    """Prepares model artifacts using UrsaSDK with pluggable serialization.
+
+    With ``workers > 0``, ``prepare``, ``prepare_bytes`` and
+    ``prepare_stream`` run deserialization and the SDK save in a pool of
+    worker processes, so a GIL-heavy load does not stall other requests;
+    only the small result comes back. Base64 and stream payloads reach the
+    worker as a temporary file, not as one in-memory buffer.
+    """
 
-    def __init__(self, sdk_dir: Path, framework: str = "pickle"):
+    def __init__(self, sdk_dir: Path, framework: str = "pickle", workers: int = 0):
         """
         Args:
             sdk_dir: Root directory for UrsaSDK storage
             framework: Default serialization framework (pickle, pytorch, tensorflow, onnx)
+            workers: Worker processes for ingestion (0 runs in-process)
         """
+        self.sdk_dir = Path(sdk_dir)
         self.sdk_client = UrsaClient(dir=sdk_dir, use_server=False)
         self.default_framework = framework
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _worker_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                # Concurrent first uploads must not each start a pool
+                if self._pool is None:
+                    # spawn: the API process runs threads, which fork does not carry safely
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._pool
+
+    def _prepare_file_in_pool(self, path: str, framework: str | None) -> ModelIngestionResult:
+        return self._worker_pool().submit(
+            _prepare_file_in_worker, self.sdk_dir, self.default_framework, path, framework
+        ).result()
 
     def prepare(self, file_b64: str, framework: str | None = None) -> ModelIngestionResult:
         """
-        Decode model data, deserialize using strategy, save via UrsaClient.
+        Decode base64 model data and hand it to ``prepare_stream``.
+        
+        The payload is decoded chunk by chunk into a spooled file (on disk
+        past 16 MiB) rather than one in-memory buffer. With worker
+        processes it is decoded into a temporary file whose path is handed
+        to a worker.
         
         Args:
             file_b64: Base64-encoded model data
@@ -45,26 +143,97 @@ class ModelIngestionAdapter:
         Returns:
             ModelIngestionResult with model_id and metadata
         """
-        # Decode base64
+        if self.workers:
+            with tempfile.NamedTemporaryFile(suffix=".upload") as staged:
+                # Decode base64
+                try:
+                    _decode_b64_into(file_b64, staged)
+                except Exception as exc:  # noqa: BLE001
+                    raise ValidationError("Invalid base64 model data") from exc
+                staged.flush()
+                return self._prepare_file_in_pool(staged.name, framework)
+
+        with tempfile.SpooledTemporaryFile(max_size=DECODE_SPOOL_MAX_BYTES) as spool:
+            # Decode base64
+            try:
+                _decode_b64_into(file_b64, spool)
+            except Exception as exc:  # noqa: BLE001
+                raise ValidationError("Invalid base64 model data") from exc
+            spool.seek(0)
+            return self.prepare_stream(spool, framework)
+
+    def prepare_bytes(self, model_bytes: ModelBytes, framework: str | None = None) -> ModelIngestionResult:
+        """
+        Deserialize raw model bytes using strategy, save via UrsaClient.
+        
+        Args:
+            model_bytes: Serialized model data
+            framework: Serialization framework (sniffed from the payload
+                header, then the default, if None)
+        
+        Returns:
+            ModelIngestionResult with model_id and metadata
+        """
+        if self.workers:
+            return self._worker_pool().submit(
+                _prepare_in_worker, self.sdk_dir, self.default_framework, model_bytes, framework
+            ).result()
+
+        # Determine serialization strategy
+        framework = framework or sniff_framework(model_bytes) or self.default_framework
+        serializer = SerializationStrategyFactory.get_strategy(framework)
+
+        # Deserialize model object
         try:
-            model_bytes = base64.b64decode(file_b64)
+            model_obj = serializer.deserialize(model_bytes)
         except Exception as exc:  # noqa: BLE001
-            raise ValidationError("Invalid base64 model data") from exc
+            raise ValidationError(f"Failed to deserialize model with {framework} strategy") from exc
+
+        return self._save(model_obj, serializer)
+
+    def prepare_stream(self, stream: BinaryIO, framework: str | None = None) -> ModelIngestionResult:
+        """
+        Deserialize a model straight from a seekable binary stream, save via UrsaClient.
+        
+        Strategies exposing ``load`` read the stream directly, so the payload
+        is never held as one ``bytes`` object; others get ``stream.read()``.
+        With worker processes the stream is copied to a temporary file in
+        fixed-size chunks and a worker loads it from there.
+        
+        Args:
+            stream: Seekable binary file object positioned at the payload start
+            framework: Serialization framework (sniffed from the payload
+                header, then the default, if None)
+        
+        Returns:
+            ModelIngestionResult with model_id and metadata
+        """
+        if self.workers:
+            with tempfile.NamedTemporaryFile(suffix=".upload") as staged:
+                shutil.copyfileobj(stream, staged, STAGE_COPY_BYTES)
+                staged.flush()
+                return self._prepare_file_in_pool(staged.name, framework)
 
         # Determine serialization strategy
-        framework = framework or self.default_framework
+        head = stream.read(SNIFF_HEADER_BYTES)
+        stream.seek(0)
+        framework = framework or sniff_framework(head) or self.default_framework
         serializer = SerializationStrategyFactory.get_strategy(framework)
 
         # Deserialize model object
+        load = getattr(serializer, "load", None)
         try:
-            model_obj = serializer.deserialize(model_bytes)
+            model_obj = load(stream) if load is not None else serializer.deserialize(stream.read())
         except Exception as exc:  # noqa: BLE001
             raise ValidationError(f"Failed to deserialize model with {framework} strategy") from exc
 
-        # Generate model name
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        model_name = f"model_{timestamp}"
-        created_at = datetime.now().isoformat()
+        return self._save(model_obj, serializer)
+
+    def _save(self, model_obj: Any, serializer: ModelSerializationStrategy) -> ModelIngestionResult:
+        # Generate model name; one clock read keeps name and created_at in step
+        now = datetime.now()
+        model_name = f"model_{now:%Y%m%d_%H%M%S}"
+        created_at = now.isoformat()
 
         # Use UrsaSDK to save model - it handles directory structure, metadata, framework detection
         try:
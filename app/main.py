@@ -1,25 +1,32 @@
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.routers import models, metrics, nodes, projects, graphs, health
 from app.domain.errors import DomainError, NotFoundError, ValidationError, ConflictError
 from app.application.event_handlers import register_event_handlers
+from app.config import settings
 
 app = FastAPI(
     title="Ursa API",
     description="API for Ursa SDK web availability",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Register domain event handlers on startup
 @app.on_event("startup")
 async def startup_event():
     register_event_handlers()
+    # Sync handlers doing disk/S3 I/O share this pool; size it so slow
+    # requests don't starve unrelated traffic
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_WORKERS
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allows all origins
-    allow_credentials=True,
+    allow_origins=settings.CORS_ORIGINS,
+    allow_credentials="*" not in settings.CORS_ORIGINS,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
 )
@@ -40,13 +47,17 @@ async def validation_error_handler(request: Request, exc: ValidationError):
 async def conflict_error_handler(request: Request, exc: ConflictError):
     return JSONResponse(status_code=409, content={"detail": str(exc)})
 
-# Include routers
-app.include_router(health.router, tags=["Health"])  # Health check endpoints first
-app.include_router(models.router, tags=["Models"])
-app.include_router(metrics.router, tags=["Metrics"])
-app.include_router(nodes.router, tags=["Nodes"])
-app.include_router(projects.router, tags=["Projects"])
-app.include_router(graphs.router, tags=["Graphs"])
+# Include routers (health check endpoints first)
+_ROUTERS = (
+    (health.router, "Health"),
+    (models.router, "Models"),
+    (metrics.router, "Metrics"),
+    (nodes.router, "Nodes"),
+    (projects.router, "Projects"),
+    (graphs.router, "Graphs"),
+)
+for router, tag in _ROUTERS:
+    app.include_router(router, tags=[tag])
 
 @app.get("/")
 async def root():
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Path, Depends
+from fastapi import APIRouter, Path, Depends, Response
 from app.schemas.api_schemas import GraphCreate, GraphResponse
 from app.dependencies import (
     get_ursaml_storage,
     get_graph_access_service,
     get_graph_validation_service,
+    get_metrics_service,
 )
 from app.domain.ports import StoragePort
 from app.application.graph_access_service import GraphAccessService
+from app.application.metrics_service import MetricsService
 from app.application.graph_validation_service import GraphValidationService
 from app.domain.errors import NotFoundError
 from typing import List, Dict, Any
@@ -43,52 +45,42 @@ def create_graph(
         created_at=graph["created_at"]
     )
 
-@router.get("/projects/{project_id}/graphs")
+@router.get("/projects/{project_id}/graphs", response_model=List[GraphResponse])
 def get_project_graphs(
     project_id: str,
     storage: StoragePort = Depends(get_ursaml_storage),
     access_svc: GraphAccessService = Depends(get_graph_access_service),
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Retrieve all graphs in a project with detailed information.
     """
     # Validate project exists
     access_svc.require_project_exists(project_id)
     
-    graphs = storage.get_project_graphs(project_id)
-    
-    # Return detailed graph information
-    return [
-        {
-            "graph_id": graph["id"],
-            "name": graph["name"],
-            "description": graph.get("description", ""),
-            "project_id": graph["project_id"],
-            "created_at": graph["created_at"]
-        }
-        for graph in graphs
-    ]
+    # Storage caches the encoded listing; skip response model validation
+    return Response(content=storage.get_project_graphs_json(project_id), media_type="application/json")
+
+def _graph_detail(graph: Dict[str, Any], project_id: str | None = None) -> Dict[str, Any]:
+    return {
+        "graph_id": graph["id"],
+        "name": graph["name"],
+        "description": graph.get("description", ""),
+        "project_id": project_id or graph["project_id"],
+        "created_at": graph["created_at"]
+    }
 
 @router.get("/projects/{project_id}/graphs/{graph_id}")
 def get_graph(
     project_id: str,
     graph_id: str,
     access_svc: GraphAccessService = Depends(get_graph_access_service),
-    storage: StoragePort = Depends(get_ursaml_storage)
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific graph.
     """
-    access_svc.require_graph_in_project(project_id, graph_id)
-    graph = storage.get_graph(graph_id)
+    graph = access_svc.require_graph_in_project(project_id, graph_id)
     
-    return {
-        "graph_id": graph["id"],
-        "name": graph["name"],
-        "description": graph.get("description", ""),
-        "project_id": graph["project_id"],
-        "created_at": graph["created_at"]
-    }
+    return _graph_detail(graph)
 
 @router.put("/projects/{project_id}/graphs/{graph_id}")
 def update_graph(
@@ -125,7 +117,8 @@ def delete_graph(
     project_id: str,
     graph_id: str,
     access_svc: GraphAccessService = Depends(get_graph_access_service),
-    storage: StoragePort = Depends(get_ursaml_storage)
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
 ):
     """
     Delete a graph and all its associated nodes and edges.
@@ -135,4 +128,7 @@ def delete_graph(
     
     # Delete the graph (this will cascade to nodes, edges, etc.)
     storage.delete_graph(graph_id)
+    
+    # Drop metrics still staged for the deleted graph
+    metrics_svc.discard(graph_id)
     return {"success": True, "graph_id": graph_id} 
\ No newline at end of file
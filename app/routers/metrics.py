@@ -1,16 +1,39 @@
 from fastapi import APIRouter, Path, Depends
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from app.schemas.api_schemas import MetricsUpload, MetricsResponse, AllNodeMetricsResponse
 from app.dependencies import get_ursaml_storage, get_metrics_service
 from app.domain.ports import StoragePort
 from app.application.metrics_service import MetricsService
-from app.domain.errors import ValidationError
+from app.domain.errors import NotFoundError, ValidationError
 from typing import Dict, Any
-import json
+import orjson
 
 router = APIRouter()
 
+# Keys reported as top-level fields rather than additional_metrics
+_RESERVED_METRIC_KEYS = frozenset({"score", "loss", "epochs", "metrics_timestamp"})
+
+
+def _format_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a node's stored meta into the metrics response format."""
+    if not metrics:
+        # Node never recorded metrics: skip the lookups and the filter pass
+        return {"accuracy": None, "loss": None, "epochs": None, "timestamp": None, "additional_metrics": {}}
+    get = metrics.get
+    return {
+        "accuracy": get("score"),
+        "loss": get("loss"),
+        "epochs": get("epochs"),
+        "timestamp": get("metrics_timestamp"),
+        "additional_metrics": {
+            k: v for k, v in metrics.items() if k not in _RESERVED_METRIC_KEYS
+        },
+    }
+
+
 @router.post("/metrics/", response_model=MetricsResponse)
-def log_metrics(
+async def log_metrics(
     metrics_data: MetricsUpload,
     metrics_svc: MetricsService = Depends(get_metrics_service)
 ):
@@ -20,12 +43,14 @@ def log_metrics(
     """
     # Parse metrics JSON
     try:
-        metrics = json.loads(metrics_data.metrics)
-    except json.JSONDecodeError as exc:
+        metrics = orjson.loads(metrics_data.metrics)
+    except orjson.JSONDecodeError as exc:
         raise ValidationError("Invalid JSON in metrics field") from exc
     
-    # Store metrics (service will validate node existence)
-    metrics_svc.add_node_metrics(
+    # Store metrics (service will validate node existence); the existence
+    # check and write-through flush touch disk, so keep them off the event loop
+    await run_in_threadpool(
+        metrics_svc.add_node_metrics,
         graph_id=metrics_data.graph_id,
         node_id=metrics_data.model_id,
         metrics={
@@ -43,90 +68,45 @@ def get_node_metrics(
     project_id: str,
     graph_id: str,
     node_id: str,
-    storage: StoragePort = Depends(get_ursaml_storage)
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
 ) -> Dict[str, Any]:
     """
     Get metrics for a specific node.
     """
-    # Get node from graph
-    nodes = storage.get_graph_nodes(graph_id)
-    node = next((n for n in nodes if n["id"] == node_id), None)
+    # Make staged metric writes visible before reading
+    metrics_svc.flush(graph_id)
+
+    # Look up the node directly instead of scanning every node in the graph
+    node = storage.get_node(graph_id, node_id)
     if not node:
-        raise HTTPException(status_code=404, detail=f"Node not found: {node_id}")
+        raise NotFoundError(f"Node not found: {node_id}")
     
     # Get metrics from node metadata
-    metrics = node.get("metadata", {}).get("meta", {})
-    if not metrics:
-        return {
-            "accuracy": None,
-            "loss": None,
-            "epochs": None,
-            "timestamp": None,
-            "additional_metrics": {}
-        }
-    
-    # Return metrics
-    result = {
-        "accuracy": metrics.get("score"),
-        "loss": metrics.get("loss"),
-        "epochs": metrics.get("epochs"),
-        "timestamp": metrics.get("metrics_timestamp")
-    }
-    
-    # Include additional metrics
-    additional_metrics = {k: v for k, v in metrics.items() 
-                        if k not in ["score", "loss", "epochs", "metrics_timestamp"]}
-    result["additional_metrics"] = additional_metrics
-    
-    return result
+    return _format_metrics(node.get("metadata", {}).get("meta", {}))
 
 @router.get("/projects/{project_id}/graphs/{graph_id}/metrics", response_model=AllNodeMetricsResponse)
 def get_all_node_metrics(
     project_id: str,
     graph_id: str,
-    storage: StoragePort = Depends(get_ursaml_storage)
-):
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
+) -> ORJSONResponse:
     """
     Get metrics for all nodes in a graph.
     """
-    # Get all nodes in the graph
-    nodes = storage.get_graph_nodes(graph_id)
-    
-    # If no nodes in graph, return empty metrics
-    if not nodes:
-        return AllNodeMetricsResponse(
-            graph_id=graph_id,
-            metrics={}
-        )
+    # Make staged metric writes visible before reading
+    metrics_svc.flush(graph_id)
+
+    # Latest metrics per node from a single graph read
+    metrics_by_node = storage.get_graph_metrics(graph_id)
     
-    # Format the metrics for the response
-    formatted_metrics = {}
-    for node in nodes:
-        metrics = node.get("metadata", {}).get("meta", {})
-        if not metrics:
-            # Include nodes with no metrics
-            formatted_metrics[node["id"]] = {
-                "accuracy": None,
-                "loss": None,
-                "epochs": None,
-                "timestamp": None,
-                "additional_metrics": {}
-            }
-            continue
-        
-        # Format metrics
-        formatted_metrics[node["id"]] = {
-            "accuracy": metrics.get("score"),
-            "loss": metrics.get("loss"),
-            "epochs": metrics.get("epochs"),
-            "timestamp": metrics.get("metrics_timestamp"),
-            "additional_metrics": {
-                k: v for k, v in metrics.items() 
-                if k not in ["score", "loss", "epochs", "metrics_timestamp"]
-            }
-        }
+    # Format the metrics for the response (nodes with no metrics get all None)
+    formatted_metrics = {
+        node_id: _format_metrics(metrics)
+        for node_id, metrics in metrics_by_node.items()
+    }
     
-    return AllNodeMetricsResponse(
-        graph_id=graph_id,
-        metrics=formatted_metrics
-    ) 
\ No newline at end of file
+    # Values come straight from stored JSON: encode directly with orjson
+    # instead of validating every node's metrics through the response model
+    return ORJSONResponse({"graph_id": graph_id, "metrics": formatted_metrics}) 
\ No newline at end of file
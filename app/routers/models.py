@@ -1,19 +1,37 @@
-from fastapi import APIRouter, Path as FastAPIPath, Depends
+from fastapi import APIRouter, Path as FastAPIPath, Depends, Query, Request
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from app.schemas.api_schemas import ModelUpload, ModelResponse, ModelDetail
 from app.domain.errors import NotFoundError
+from app.domain.model_sniff import SNIFF_HEADER_BYTES
+from app.domain.strategies import PickleSerializationStrategy
 from typing import Dict
 from datetime import datetime
-import base64
 from pathlib import Path
-import json
+import tempfile
 from ursakit.client import UrsaClient
 from app.dependencies import get_cache_manager, get_model_app_service
 from app.services.cache.cache_manager import ModelCacheManager
 from app.services.model_app_service import ModelAppService
 from app.config import settings
 
+try:  # SIMD-accelerated codec when available
+    import pybase64 as _b64
+    # Encodes straight to str, without an intermediate bytes object
+    _b64encode_str = _b64.b64encode_as_string
+except ImportError:  # pragma: no cover - fallback to stdlib
+    import base64 as _b64
+
+    def _b64encode_str(data: bytes) -> str:
+        return _b64.b64encode(data).decode('ascii')
+
 router = APIRouter()
 
+# Raw uploads up to this size stay in memory; larger ones spill to disk
+UPLOAD_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+# Body bytes gathered before each spool write, which runs in the threadpool
+UPLOAD_WRITE_BATCH_BYTES = 1024 * 1024
+
 
 @router.post("/models/", response_model=ModelResponse, status_code=201)
 def save_model(
@@ -24,16 +42,52 @@ def save_model(
     Upload and save a serialized ML model.
     """
     result = service.upload_model(model_data.file, model_data.graph_id)
-    return ModelResponse(
-        model_id=result["model_id"],
-        node_id=result["node_id"],
-        name=result["name"],
-        statistics={
-            "framework": "unknown",
-            "model_type": "unknown",
-            "created_at": result["created_at"],
-            "storage_type": "file"
-        }
+    return _model_response(result)
+
+@router.post("/models/binary", response_model=ModelResponse, status_code=201)
+async def save_model_binary(
+    request: Request,
+    graph_id: str = Query(..., description="ID of the graph to add the model to"),
+    service: ModelAppService = Depends(get_model_app_service)
+):
+    """
+    Upload a serialized ML model sent as a raw application/octet-stream body.
+
+    Preferred for large models: skips the base64 encoding and JSON parsing
+    of the body, and the body is spooled (to disk past 16 MiB) and
+    deserialized from the file rather than buffered as one bytes object.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES) as spool:
+        # Past the spool limit writes hit the disk: keep them off the event
+        # loop, batched so small body chunks don't each cost a thread hop
+        pending = bytearray()
+        async for chunk in request.stream():
+            pending += chunk
+            if len(pending) >= UPLOAD_WRITE_BATCH_BYTES:
+                await run_in_threadpool(spool.write, bytes(pending))
+                pending.clear()
+        if pending:
+            await run_in_threadpool(spool.write, bytes(pending))
+        spool.seek(0)
+        result = await run_in_threadpool(service.upload_model_stream, spool, graph_id)
+    return _model_response(result)
+
+def _model_response(result: Dict) -> ORJSONResponse:
+    # Built from the service's own result: encode directly with orjson
+    # instead of validating it again through the response model
+    return ORJSONResponse(
+        {
+            "model_id": result["model_id"],
+            "node_id": result["node_id"],
+            "name": result["name"],
+            "statistics": {
+                "framework": "unknown",
+                "model_type": "unknown",
+                "created_at": result["created_at"],
+                "storage_type": "file"
+            },
+        },
+        status_code=201,
     )
 
 @router.get("/models/{model_id}", response_model=ModelDetail)
@@ -42,56 +96,113 @@ def get_model(
     cache_service: ModelCacheManager = Depends(get_cache_manager)
 ):
     """
-    Get model metadata by ID using UrsaSDK.
+    Get model metadata by ID.
     """
     try:
-        # Get model directory from cache
-        model_dir = cache_service.get_model_for_sdk(model_id)
-        
-        # Use UrsaClient to access metadata
-        sdk_client = UrsaClient(dir=model_dir)
-        metadata = sdk_client.get_metadata(model_id)
+        # Metadata comes straight from the cache; no SDK workspace copy is needed
+        metadata = cache_service.get_metadata(model_id)
         
-        return ModelDetail(
-            model_id=model_id,
-            framework=metadata.get("framework", "unknown"),
-            model_type=metadata.get("model_type", "unknown"),
-            created_at=datetime.fromisoformat(metadata["created_at"])
-        )
-    except (FileNotFoundError, KeyError, json.JSONDecodeError) as exc:
+        # orjson writes the datetime in the same ISO form the model would
+        return ORJSONResponse({
+            "model_id": model_id,
+            "framework": metadata.get("framework", "unknown"),
+            "model_type": metadata.get("model_type", "unknown"),
+            "created_at": datetime.fromisoformat(metadata["created_at"]),
+        })
+    except (FileNotFoundError, KeyError, ValueError) as exc:
         raise NotFoundError(f"Model not found: {model_id}") from exc
 
 @router.get("/models/{model_id}/data")
 def load_model_data(
     model_id: str = FastAPIPath(..., title="The ID of the model to load"),
+    response_format: str = Query(
+        "json", alias="format", pattern="^(json|binary)$",
+        description="json: base64 in a JSON body; binary: the raw artifact",
+    ),
     cache_service: ModelCacheManager = Depends(get_cache_manager)
 ):
     """
     Load model binary data by ID using UrsaSDK.
+
+    ``?format=binary`` sends the stored artifact as application/octet-stream
+    (as /download does) instead of base64 inside JSON.
     """
+    if response_format == "binary":
+        return download_model(model_id, cache_service)
+
     try:
-        # Get model directory from cache
-        model_dir = cache_service.get_model_for_sdk(model_id)
-        
-        # Use UrsaClient to load the model object
-        sdk_client = UrsaClient(dir=model_dir)
-        model_obj = sdk_client.load(model_id)
-        metadata = sdk_client.get_metadata(model_id)
+        # A stored plain pickle is already what we would send: skip the
+        # unpickle/re-pickle round-trip and the SDK workspace copy
+        model_file, metadata = cache_service.resolve_model_file(model_id)
         
-        # Serialize the model object back to bytes using pickle (default)
-        import pickle
-        model_bytes = pickle.dumps(model_obj)
+        if _is_plain_pickle(model_file, metadata):
+            model_bytes = model_file.read_bytes()
+        else:
+            # Get model directory from cache
+            model_dir = cache_service.get_model_for_sdk(model_id)
+            try:
+                # Use UrsaClient to load the model object
+                sdk_client = UrsaClient(dir=model_dir)
+                model_obj = sdk_client.load(model_id)
+                metadata = sdk_client.get_metadata(model_id)
+            finally:
+                # The workspace holds hardlinks to cached artifacts
+                cache_service.release_sdk_workspace(model_dir)
+            
+            # Serialize the model object back to bytes using pickle (default)
+            model_bytes = PickleSerializationStrategy().serialize(model_obj)
         
         # Return base64 encoded data
         return {
             "model_id": model_id,
-            "data": base64.b64encode(model_bytes).decode('utf-8'),
+            "data": _b64encode_str(model_bytes),
             "framework": metadata.get("framework", "unknown"),
             "model_type": metadata.get("model_type", "unknown")
         }
-    except (FileNotFoundError, KeyError) as exc:
+    except (FileNotFoundError, KeyError, ValueError) as exc:
         raise NotFoundError(f"Model not found: {model_id}") from exc
 
+def _is_plain_pickle(model_file: Path, metadata: Dict) -> bool:
+    """Whether clients can ``pickle.loads`` the artifact as stored.
+
+    A serializer recorded in the metadata decides; otherwise only the
+    file's header is sniffed.
+    """
+    serializer = metadata.get("serializer")
+    if serializer is not None:
+        return str(serializer).lower() == "pickle"
+    with model_file.open("rb") as handle:
+        head = handle.read(SNIFF_HEADER_BYTES)
+    # Protocol 2+ pickle header; a joblib reference in it marks a container
+    # that needs joblib's own unpickler for its array data
+    return len(head) >= 2 and head[0] == 0x80 and 2 <= head[1] <= 5 and b"joblib" not in head
+
+@router.get("/models/{model_id}/download")
+def download_model(
+    model_id: str = FastAPIPath(..., title="The ID of the model to download"),
+    cache_service: ModelCacheManager = Depends(get_cache_manager)
+):
+    """
+    Send the stored model artifact as application/octet-stream.
+
+    Serves the file as saved by UrsaSDK, without loading the model or
+    base64-encoding it (servers with zero-copy support use sendfile);
+    model metadata travels in X-Model-* headers.
+    """
+    try:
+        model_file, metadata = cache_service.resolve_model_file(model_id)
+    except (FileNotFoundError, KeyError, ValueError) as exc:
+        raise NotFoundError(f"Model not found: {model_id}") from exc
+    return FileResponse(
+        model_file,
+        media_type="application/octet-stream",
+        headers={
+            "X-Model-Id": model_id,
+            "X-Framework": str(metadata.get("framework", "unknown")),
+            "X-Model-Type": str(metadata.get("model_type", "unknown")),
+        },
+    )
+
 @router.delete("/models/{model_id}")
 def delete_model(
     model_id: str = FastAPIPath(..., title="The ID of the model to delete"),
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Path, Depends
-from app.schemas.api_schemas import NodeUpdate, NodeResponse, GraphStructure, Node as NodeSchema, Edge
-from app.dependencies import get_ursaml_storage, get_graph_access_service
+from fastapi.responses import ORJSONResponse
+from app.schemas.api_schemas import NodeUpdate, NodeResponse, GraphStructure
+from app.dependencies import get_ursaml_storage, get_graph_access_service, get_metrics_service
 from app.domain.ports import StoragePort
 from app.application.graph_access_service import GraphAccessService
+from app.application.metrics_service import MetricsService
 from app.domain.errors import NotFoundError, ValidationError
 from typing import List
 
@@ -14,7 +16,8 @@ def delete_node(
     graph_id: str,
     node_id: str,
     access_svc: GraphAccessService = Depends(get_graph_access_service),
-    storage: StoragePort = Depends(get_ursaml_storage)
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
 ):
     """
     Delete a node from the knowledge graph.
@@ -22,11 +25,12 @@ def delete_node(
     # Validate graph exists and belongs to project
     access_svc.require_graph_in_project(project_id, graph_id)
     
-    # Validate node exists
-    access_svc.require_node_exists(graph_id, node_id)
+    # Delete the node; a missing node comes back as False, so no separate lookup
+    if not storage.delete_node(graph_id, node_id):
+        raise NotFoundError(f"Node not found: {node_id}")
     
-    # Delete the node
-    storage.delete_node(graph_id, node_id)
+    # Drop metrics still staged for the deleted node
+    metrics_svc.discard(graph_id, node_id)
     
     return NodeResponse(success=True)
 
@@ -41,15 +45,13 @@ def update_node(
     """
     Update node attributes in the knowledge graph.
     """
-    # Validate node exists
-    access_svc.require_node_exists(graph_id, node_id)
-    
     # Validate metadata is provided
     if not node_data.metadata:
         raise ValidationError("Metadata is required for node update")
     
-    # Update the node
-    storage.update_node(graph_id, node_id, node_data.metadata)
+    # Update the node; a missing node comes back as None, so no separate lookup
+    if not storage.update_node(graph_id, node_id, node_data.metadata):
+        raise NotFoundError(f"Node not found: {node_id}")
     
     return NodeResponse(success=True)
 
@@ -68,17 +70,15 @@ def replace_node_model(
     # Validate graph exists and belongs to project
     access_svc.require_graph_in_project(project_id, graph_id)
     
-    # Validate node exists
-    access_svc.require_node_exists(graph_id, node_id)
-    
     # Validate model_id is provided in metadata
     if not node_data.metadata or "model_id" not in node_data.metadata:
         raise ValidationError("model_id is required in metadata")
     
     model_id = node_data.metadata["model_id"]
     
-    # Update node with new model
-    storage.update_node(graph_id, node_id, {"model_id": model_id})
+    # Update node with new model; a missing node comes back as None
+    if not storage.update_node(graph_id, node_id, {"model_id": model_id}):
+        raise NotFoundError(f"Node not found: {node_id}")
     
     return NodeResponse(success=True)
 
@@ -87,43 +87,44 @@ def get_nodes(
     project_id: str,
     graph_id: str,
     access_svc: GraphAccessService = Depends(get_graph_access_service),
-    storage: StoragePort = Depends(get_ursaml_storage)
-):
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
+) -> ORJSONResponse:
     """
     Retrieve full information of nodes and edges of knowledge graph.
     """
     # Validate graph exists and belongs to project
     access_svc.require_graph_in_project(project_id, graph_id)
     
-    # Get nodes and edges for the graph
-    nodes = storage.get_graph_nodes(graph_id)
-    edges = storage.get_graph_edges(graph_id)
-    
-    # Convert to schema format
-    node_schemas = [
-        NodeSchema(
-            id=node["id"], 
-            name=node["name"], 
-            model_id=node["model_id"] or "",
-            metadata=node["metadata"]
-        ) 
+    # Write staged metrics first so node metadata is current
+    metrics_svc.flush(graph_id)
+    
+    # Get nodes and edges for the graph from a single read
+    nodes, edges = storage.get_graph_structure(graph_id)
+    
+    # Convert to schema format; rows come from our own storage, so encode
+    # them directly with orjson instead of validating each one
+    node_rows = [
+        {
+            "id": node["id"],
+            "name": node["name"],
+            "model_id": node["model_id"] or "",
+            "metadata": node["metadata"],
+        }
         for node in nodes
     ]
     
-    edge_schemas = [
-        Edge(
-            source=edge["source_id"], 
-            target=edge["target_id"], 
-            type=edge["type"] or "default",
-            weight=edge["weight"]
-        ) 
+    edge_rows = [
+        {
+            "source": edge["source_id"],
+            "target": edge["target_id"],
+            "type": edge["type"] or "default",
+            "weight": float(edge["weight"]),
+        }
         for edge in edges
     ]
     
-    return GraphStructure(
-        nodes=node_schemas,
-        edges=edge_schemas
-    )
+    return ORJSONResponse({"nodes": node_rows, "edges": edge_rows})
 
 @router.post("/projects/{project_id}/graphs/{graph_id}/nodes")
 def create_node(
@@ -162,11 +163,15 @@ def get_node_detail(
     project_id: str,
     graph_id: str,
     node_id: str,
-    storage: StoragePort = Depends(get_ursaml_storage)
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
 ):
     """
     Get detailed information about a specific node.
     """
+    # Write staged metrics first so node metadata is current
+    metrics_svc.flush(graph_id)
+    
     # Validate node exists
     node = storage.get_node(graph_id, node_id)
     if not node:
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Path, Depends
 from app.schemas.api_schemas import ProjectCreate, ProjectResponse, ProjectDetail, ProjectDeleteResponse
-from app.dependencies import get_ursaml_storage, get_project_validation_service
+from app.dependencies import get_ursaml_storage, get_project_validation_service, get_metrics_service
 from app.domain.ports import StoragePort
 from app.application.project_validation_service import ProjectValidationService
+from app.application.metrics_service import MetricsService
 from app.domain.errors import NotFoundError
 from typing import List
 
@@ -95,16 +96,20 @@ def update_project(
 @router.delete("/projects/{project_id}", response_model=ProjectDeleteResponse)
 def delete_project(
     project_id: str = Path(..., title="The ID of the project to delete"),
-    storage: StoragePort = Depends(get_ursaml_storage)
+    storage: StoragePort = Depends(get_ursaml_storage),
+    metrics_svc: MetricsService = Depends(get_metrics_service)
 ):
     """
     Delete a project and all its associated graphs, nodes, and models.
     """
-    # Validate project exists
-    project = storage.get_project(project_id)
-    if not project:
+    graph_ids = [graph["id"] for graph in storage.get_project_graphs(project_id)]
+    
+    # Delete the project (this will cascade to graphs, nodes, etc.);
+    # an unknown id comes back as False
+    if not storage.delete_project(project_id):
         raise NotFoundError(f"Project not found: {project_id}")
     
-    # Delete the project (this will cascade to graphs, nodes, etc.)
-    storage.delete_project(project_id)
+    # Drop metrics still staged for the deleted graphs
+    for graph_id in graph_ids:
+        metrics_svc.discard(graph_id)
     return ProjectDeleteResponse(success=True) 
\ No newline at end of file
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import json
+import os
+import shutil
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
 
 from .local_cache import LocalCacheRepository
 from .metadata_store import CacheMetadataStore
@@ -12,6 +16,15 @@ from .sdk_workspace import SDKWorkspaceManager
 from .cache_policy import CachePolicy
 
 
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hardlink ``source`` to ``target``, copying when links are unsupported."""
+    try:
+        os.link(source, target)
+    except OSError:
+        # Cross-device or no hardlink support on this filesystem
+        shutil.copy2(source, target)
+
+
 class ModelCacheManager:
     """Orchestrates local cache, remote sync, and SDK workspace preparation.
 
@@ -61,9 +74,10 @@ class ModelCacheManager:
             raise ValueError("No model file found in metadata after S3 download")
 
         # update summary metadata
+        now = datetime.now().isoformat()
         entry = {
-            "cached_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
+            "cached_at": now,
+            "last_accessed": now,
             "size_bytes": self._local.directory_size_bytes(cache_dir),
         }
         self._meta.upsert(model_id, entry)
@@ -75,13 +89,10 @@ class ModelCacheManager:
 
         # verify local cache
         cache_dir = self._local.model_dir(model_id)
-        metadata_path = cache_dir / "metadata.json"
-        if not cache_dir.exists() or not metadata_path.exists():
+        metadata = self._local.read_model_metadata(model_id)
+        if metadata is None:
             raise ValueError(f"Model {model_id} not found in cache or remote storage")
 
-        with metadata_path.open("r", encoding="utf-8") as handle:
-            metadata = json.load(handle)
-
         model_file = self._resolve_model_path_from_metadata(metadata, cache_dir)
         if not model_file:
             raise ValueError("No model file found in metadata")
@@ -90,45 +101,97 @@ class ModelCacheManager:
         workspace = self._sdk.create_workspace()
         target_models_dir = workspace / "models"
         target_model_dir = target_models_dir / model_id
-        target_model_dir.mkdir(parents=True, exist_ok=True)
+        target_model_dir.mkdir()
 
-        # replicate entire cache directory contents
-        # We avoid shutil.copytree to retain control; but cache repo exposes a simple copy capability
-        from shutil import copy2
+        # replicate cache directory contents as hardlinks, so the artifacts
+        # are not copied byte for byte; metadata.json is skipped because it
+        # is rewritten below and must not share an inode with the cache
         for file_path in cache_dir.rglob("*"):
-            if not file_path.is_file():
+            if not file_path.is_file() or file_path.name == "metadata.json":
                 continue
-            copy2(str(file_path), str(target_model_dir / file_path.name))
+            _link_or_copy(file_path, target_model_dir / file_path.name)
 
-        # rewrite metadata paths to point inside workspace
+        # rewrite metadata paths to point inside workspace; the parsed
+        # metadata is shared, so changed entries are copied, not edited
         updated_metadata = dict(metadata)
         if "path" in updated_metadata:
             updated_metadata["path"] = str(target_model_dir / Path(updated_metadata["path"]).name)
         artifacts = updated_metadata.get("artifacts", {})
         if isinstance(artifacts, dict):
-            for value in artifacts.values():
-                if isinstance(value, dict) and "path" in value:
-                    value["path"] = str(target_model_dir / Path(value["path"]).name)
-
-        with (target_model_dir / "metadata.json").open("w", encoding="utf-8") as handle:
-            json.dump(updated_metadata, handle, indent=2)
+            updated_metadata["artifacts"] = {
+                key: (
+                    {**value, "path": str(target_model_dir / Path(value["path"]).name)}
+                    if isinstance(value, dict) and "path" in value
+                    else value
+                )
+                for key, value in artifacts.items()
+            }
+
+        (target_model_dir / "metadata.json").write_bytes(
+            orjson.dumps(updated_metadata, option=orjson.OPT_INDENT_2)
+        )
 
         # touch access time
         self._meta.touch_accessed(model_id, datetime.now().isoformat())
 
         return workspace
 
-    def save_model_from_sdk(self, model_id: str, sdk_dir: Path) -> Path:
-        """Persist model from SDK workspace into cache and optionally upload to S3."""
+    def release_sdk_workspace(self, workspace: Path) -> None:
+        """Remove a workspace returned by ``get_model_for_sdk``."""
+        self._sdk.cleanup(workspace)
+
+    def get_metadata(self, model_id: str) -> Dict[str, Any]:
+        """Return a cached model's parsed metadata without preparing a workspace.
+
+        Served from the in-memory parse while metadata.json is unchanged;
+        the dict is shared and must not be mutated.
+        """
+        self._refresh_from_s3_if_needed(model_id, force_refresh=False)
+        metadata = self._local.read_model_metadata(model_id)
+        if metadata is None:
+            raise ValueError(f"Model {model_id} not found in cache or remote storage")
+        return metadata
+
+    def resolve_model_file(self, model_id: str) -> Tuple[Path, Dict[str, Any]]:
+        """Return the cached model artifact's path and its metadata.
+
+        The file can be served as is; it is not copied into an SDK workspace.
+        """
+        self._refresh_from_s3_if_needed(model_id, force_refresh=False)
+
+        cache_dir = self._local.model_dir(model_id)
+        metadata = self._local.read_model_metadata(model_id)
+        if metadata is None:
+            raise ValueError(f"Model {model_id} not found in cache or remote storage")
+
+        model_file = self._resolve_model_path_from_metadata(metadata, cache_dir)
+        if not model_file:
+            raise ValueError("No model file found in metadata")
+
+        # touch access time
+        self._meta.touch_accessed(model_id, datetime.now().isoformat())
+
+        return model_file, metadata
+
+    def save_model_from_sdk(self, model_id: str, sdk_dir: Path, move: bool = False) -> Path:
+        """Persist model from SDK workspace into cache and optionally upload to S3.
+
+        With ``move=True`` the SDK model directory is moved into the cache
+        instead of copied, for staging directories that are not read again.
+        """
         sdk_model_dir = sdk_dir / "models" / model_id
         if not sdk_model_dir.exists():
             raise ValueError(f"Model {model_id} not found in SDK directory")
 
-        cache_dir = self._local.copy_from_sdk(sdk_model_dir, model_id)
+        if move:
+            cache_dir = self._local.move_from_sdk(sdk_model_dir, model_id)
+        else:
+            cache_dir = self._local.copy_from_sdk(sdk_model_dir, model_id)
 
+        now = datetime.now().isoformat()
         entry = {
-            "cached_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
+            "cached_at": now,
+            "last_accessed": now,
             "size_bytes": self._local.directory_size_bytes(cache_dir),
         }
         self._meta.upsert(model_id, entry)
@@ -144,15 +207,23 @@ class ModelCacheManager:
 
     def delete_model(self, model_id: str) -> bool:
         """Delete model from cache and remote if configured."""
+        remote = None
+        if self._s3_enabled:
+            # Overlap the remote round-trip with the local cleanup
+            remote = threading.Thread(target=self._delete_remote, args=(model_id,), daemon=True)
+            remote.start()
         self._local.remove_model_dir(model_id)
         self._meta.remove(model_id)
-        if self._s3_enabled:
-            try:
-                self._s3.delete(model_id)
-            except Exception:
-                pass
+        if remote is not None:
+            remote.join()
         return True
 
+    def _delete_remote(self, model_id: str) -> None:
+        try:
+            self._s3.delete(model_id)
+        except Exception:
+            pass
+
     def cleanup_old_cache(self, max_age_days: int = 7, max_size_gb: float = 10.0) -> None:
         cutoff = datetime.now() - timedelta(days=max_age_days)
         total_size = self._meta.total_size_bytes()
@@ -180,6 +251,16 @@ class ModelCacheManager:
                 self.delete_model(model_id)
                 total_size -= size
 
+    def remote_status(self) -> str:
+        """Report S3 reachability: not_configured, reachable or unreachable."""
+        if not self._s3_enabled:
+            return "not_configured"
+        try:
+            self._s3.ping()
+        except Exception:
+            return "unreachable"
+        return "reachable"
+
     def get_cache_stats(self) -> Dict[str, Any]:
         total_size = self._meta.total_size_bytes()
         return {
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-import json
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
+
+@lru_cache(maxsize=1024)
+def _parse_metadata(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # Keyed on the file's stat, so a rewritten file misses and stale
+    # entries simply age out
+    with open(path, "rb") as handle:
+        return orjson.loads(handle.read())
+
 
 class LocalCacheRepository:
     """Handle filesystem operations for cached models."""
@@ -27,17 +37,21 @@ class LocalCacheRepository:
         return path
 
     def read_model_metadata(self, model_id: str) -> Dict[str, Any] | None:
+        """Parsed metadata.json, reused while the file is unchanged.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
         metadata_file = self.metadata_path(model_id)
-        if not metadata_file.exists():
+        try:
+            stat = metadata_file.stat()
+        except FileNotFoundError:
             return None
-        with metadata_file.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return _parse_metadata(str(metadata_file), stat.st_mtime_ns, stat.st_size)
 
     def write_model_metadata(self, model_id: str, metadata: Dict[str, Any]) -> None:
         metadata_file = self.metadata_path(model_id)
         metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        with metadata_file.open("w", encoding="utf-8") as handle:
-            json.dump(metadata, handle, indent=2)
+        metadata_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
     @staticmethod
     def resolve_model_path(metadata: Dict[str, Any], base_dir: Path) -> Optional[Path]:
@@ -73,6 +87,15 @@ class LocalCacheRepository:
         shutil.copytree(sdk_model_dir, cache_path, dirs_exist_ok=True)
         return cache_path
 
+    def move_from_sdk(self, sdk_model_dir: Path, model_id: str) -> Path:
+        # A rename on the same filesystem; shutil.move copies across devices
+        cache_path = self.model_dir(model_id)
+        if cache_path.exists():
+            shutil.rmtree(cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(sdk_model_dir), str(cache_path))
+        return cache_path
+
     def remove_model_dir(self, model_id: str) -> None:
         cache_path = self.model_dir(model_id)
         if cache_path.exists():
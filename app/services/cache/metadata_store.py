@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import orjson
 
 
 class CacheMetadataStore:
-    """Persistence helper for cache metadata summary information."""
+    """Persistence helper for cache metadata summary information.
+
+    Reloads from disk when the file changes underneath a long-lived instance.
+    """
 
     def __init__(self, metadata_file: Path) -> None:
         self._metadata_file = metadata_file
         self._metadata_file.parent.mkdir(parents=True, exist_ok=True)
+        self._signature = self._file_signature()
         self._data: Dict[str, Dict[str, Any]] = self._load()
 
     @property
@@ -20,41 +25,52 @@ class CacheMetadataStore:
     def _load(self) -> Dict[str, Dict[str, Any]]:
         if self._metadata_file.exists():
             try:
-                with self._metadata_file.open("r", encoding="utf-8") as handle:
-                    raw = json.load(handle)
+                raw = orjson.loads(self._metadata_file.read_bytes())
                 if isinstance(raw, dict):
                     return {str(key): dict(value) for key, value in raw.items() if isinstance(value, dict)}
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {}
         return {}
 
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._metadata_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     @property
     def data(self) -> Dict[str, Dict[str, Any]]:
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._signature = signature
+            self._data = self._load()
         return self._data
 
     def get(self, model_id: str) -> Dict[str, Any] | None:
-        return self._data.get(model_id)
+        return self.data.get(model_id)
 
     def upsert(self, model_id: str, metadata: Dict[str, Any]) -> None:
-        self._data[model_id] = dict(metadata)
+        self.data[model_id] = dict(metadata)
         self.save()
 
     def remove(self, model_id: str) -> None:
-        if model_id in self._data:
+        if model_id in self.data:
             del self._data[model_id]
             self.save()
 
     def touch_accessed(self, model_id: str, timestamp: str) -> None:
-        entry = self._data.setdefault(model_id, {})
+        entry = self.data.setdefault(model_id, {})
         entry["last_accessed"] = timestamp
         self.save()
 
     def items(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
-        return self._data.items()
+        return self.data.items()
 
     def total_size_bytes(self) -> int:
-        return sum(entry.get("size_bytes", 0) for entry in self._data.values())
+        return sum(entry.get("size_bytes", 0) for entry in self.data.values())
 
     def save(self) -> None:
-        with self._metadata_file.open("w", encoding="utf-8") as handle:
-            json.dump(self._data, handle, indent=2)
\ No newline at end of file
+        self._metadata_file.parent.mkdir(parents=True, exist_ok=True)
+        self._metadata_file.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+        self._signature = self._file_signature()
\ No newline at end of file
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
 
 class ModelS3Gateway:
     """Encapsulate all interactions with S3 for cached models."""
@@ -22,8 +23,7 @@ class ModelS3Gateway:
             str(metadata_path)
         )
 
-        with metadata_path.open("r", encoding="utf-8") as handle:
-            metadata = json.load(handle)
+        metadata = orjson.loads(metadata_path.read_bytes())
 
         artifacts = metadata.get("artifacts", {})
         if isinstance(artifacts, dict):
@@ -57,6 +57,10 @@ class ModelS3Gateway:
             key = f"models/{model_id}/{file_path.name}"
             self._client.upload_file(str(file_path), self._bucket, key)
 
+    def ping(self) -> None:
+        """Raise if the bucket is unreachable; HEAD is O(1), unlike listing keys."""
+        self._client.head_bucket(Bucket=self._bucket)
+
     def delete(self, model_id: str) -> None:
         response = self._client.list_objects_v2(
             Bucket=self._bucket,
@@ -80,5 +84,8 @@ class NullModelS3Gateway(ModelS3Gateway):
     def upload(self, model_id: str, source_dir: Path) -> None:  # pragma: no cover - simple passthrough
         return
 
+    def ping(self) -> None:  # pragma: no cover - simple passthrough
+        raise ValueError("S3 storage is not configured")
+
     def delete(self, model_id: str) -> None:  # pragma: no cover - simple passthrough
         return
\ No newline at end of file
@@ -13,9 +13,9 @@ class SDKWorkspaceManager:
         self.sdk_root.mkdir(parents=True, exist_ok=True)
 
     def create_workspace(self) -> Path:
+        # sdk_root exists from __init__ and the id is fresh: one mkdir pass
         workspace = self.sdk_root / str(uuid.uuid4())
-        workspace.mkdir(parents=True, exist_ok=True)
-        (workspace / "models").mkdir(parents=True, exist_ok=True)
+        (workspace / "models").mkdir(parents=True)
         return workspace
 
     def cleanup(self, workspace: Path) -> None:
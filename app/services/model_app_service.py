@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict
 
 from app.domain.ports import StoragePort, CachePort
 from app.domain.errors import ValidationError, NotFoundError
 from app.domain.entities import ModelUploadResult
 from app.domain.events import event_publisher, ModelUploaded, ModelDeleted
-from app.infrastructure.model_ingestion_adapter import ModelIngestionAdapter
+from app.domain.strategies import ModelBytes
+from app.infrastructure.model_ingestion_adapter import ModelIngestionAdapter, ModelIngestionResult
 
 
 class ModelAppService:
@@ -25,6 +26,31 @@ class ModelAppService:
     def upload_model(self, file_b64: str, graph_id: str) -> ModelUploadResult:
         if not file_b64:
             raise ValidationError("Model file data is required")
+        self._require_graph(graph_id)
+
+        # Prepare model artifact
+        return self._register(self._ingestion.prepare(file_b64), graph_id)
+
+    def upload_model_bytes(self, model_bytes: ModelBytes, graph_id: str) -> ModelUploadResult:
+        """Upload raw model bytes, skipping the base64 round-trip."""
+        if not model_bytes:
+            raise ValidationError("Model file data is required")
+        self._require_graph(graph_id)
+
+        # Prepare model artifact
+        return self._register(self._ingestion.prepare_bytes(model_bytes), graph_id)
+
+    def upload_model_stream(self, stream: BinaryIO, graph_id: str) -> ModelUploadResult:
+        """Upload a model read from a seekable binary stream (e.g. a spooled request body)."""
+        if not stream.read(1):
+            raise ValidationError("Model file data is required")
+        stream.seek(0)
+        self._require_graph(graph_id)
+
+        # Prepare model artifact
+        return self._register(self._ingestion.prepare_stream(stream), graph_id)
+
+    def _require_graph(self, graph_id: str) -> None:
         if not graph_id:
             raise ValidationError("Graph ID is required")
 
@@ -33,11 +59,10 @@ class ModelAppService:
         if not graph:
             raise NotFoundError(f"Graph not found: {graph_id}")
 
-        # Prepare model artifact
-        result = self._ingestion.prepare(file_b64)
-
-        # Cache persist
-        self._cache.save_model_from_sdk(result.model_id, result.sdk_dir)
+    def _register(self, result: ModelIngestionResult, graph_id: str) -> ModelUploadResult:
+        # Cache persist; reads go through the cache, so the freshly saved
+        # SDK copy is moved rather than written a second time
+        self._cache.save_model_from_sdk(result.model_id, result.sdk_dir, move=True)
 
         # Graph node registration
         node = self._storage.create_node(
@@ -53,8 +78,6 @@ class ModelAppService:
 
         # Publish domain event
         event_publisher.publish(ModelUploaded(
-            event_id="",
-            timestamp=None,
             aggregate_id=result.model_id,
             model_id=result.model_id,
             node_id=node["id"],
@@ -1,36 +1,154 @@
 from __future__ import annotations
 
-import json
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, DefaultDict, Dict, Iterator, Optional, Set, Tuple
+
+import orjson
+
+NameKey = Tuple[str, ...]
+
+
+def project_name_key(name: str) -> NameKey:
+    """Index key for a project name (unique case-insensitively).
+
+    Names are casefolded, so Unicode case variants such as "STRASSE" and
+    "straße" collide as well.
+    """
+    return ("project", name.casefold())
+
+
+def graph_name_key(project_id: str, name: str) -> NameKey:
+    """Index key for a graph name (unique case-insensitively per project)."""
+    return ("graph", project_id, name.casefold())
 
 
 class MetadataStore:
-    """Simple JSON-backed metadata store for UrsaML aggregates."""
+    """Simple JSON-backed metadata store for UrsaML aggregates.
+
+    Also maintains an in-memory case-insensitive name index so duplicate-name
+    checks are a dict lookup rather than a scan. The index is built lazily
+    and discarded whenever ``data`` is replaced wholesale.
+
+    Saves issued inside ``unit_of_work()`` are deferred and written once
+    when the outermost block exits; the block also holds a lock so
+    concurrent mutations of a shared store are serialized.
+
+    The store can be long-lived: ``data`` is reloaded when the file on disk
+    changes underneath it (another store instance or process wrote it).
+    ``revision`` changes on every save and reload, so callers can key
+    derived caches on it.
+    """
 
     def __init__(self, metadata_file: Path) -> None:
         self.metadata_file = metadata_file
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        self.data: Dict[str, Any] = self._load()
+        self._name_index: Optional[DefaultDict[NameKey, Set[str]]] = None
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
+        self._revision = 0
+        self._signature = self._file_signature()
+        self.data = self._load()
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if not self._batch_depth:
+            signature = self._file_signature()
+            if signature != self._signature:
+                self._signature = signature
+                self.data = self._load()
+        return self._data
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
+        self._name_index = None
+        self._revision += 1
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever ``data`` is saved or replaced."""
+        # Reading data first picks up (and counts) outside writes
+        self.data
+        return self._revision
 
     def _load(self) -> Dict[str, Any]:
         if self.metadata_file.exists():
             try:
-                with self.metadata_file.open("r", encoding="utf-8") as handle:
-                    raw = json.load(handle)
+                raw = orjson.loads(self.metadata_file.read_bytes())
                 if isinstance(raw, dict):
                     # Ensure expected top-level keys exist
                     raw.setdefault("projects", {})
                     raw.setdefault("graphs", {})
                     raw.setdefault("models", {})
                     return raw
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
         return {"projects": {}, "graphs": {}, "models": {}}
 
     def save(self) -> None:
-        with self.metadata_file.open("w", encoding="utf-8") as handle:
-            json.dump(self.data, handle, indent=2)
+        self._revision += 1
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self) -> None:
+        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
+        self.metadata_file.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+        self._signature = self._file_signature()
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.metadata_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group several mutations so the metadata file is written once."""
+        with self._lock:
+            if not self._batch_depth:
+                # Pick up outside writes before mutating
+                self.data
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._dirty:
+                    self._dirty = False
+                    # Keep disk in step with memory even if a step failed
+                    self._write()
+
+    # --------------- Name index ---------------
+    def _names(self) -> DefaultDict[NameKey, Set[str]]:
+        # Reading data first drops the index if the file was reloaded
+        data = self.data
+        if self._name_index is None:
+            index: DefaultDict[NameKey, Set[str]] = defaultdict(set)
+            for project in data.get("projects", {}).values():
+                index[project_name_key(project["name"])].add(project["id"])
+            for graph in data.get("graphs", {}).values():
+                index[graph_name_key(graph["project_id"], graph["name"])].add(graph["id"])
+            self._name_index = index
+        return self._name_index
 
+    def ids_with_name(self, key: NameKey) -> Set[str]:
+        """Return ids of entities indexed under ``key``."""
+        return self._names().get(key, set())
 
+    def index_name(self, key: NameKey, entity_id: str) -> None:
+        self._names()[key].add(entity_id)
 
+    def unindex_name(self, key: NameKey, entity_id: str) -> None:
+        index = self._names()
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del index[key]
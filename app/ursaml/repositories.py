@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import shutil
-import uuid
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .metadata import MetadataStore
+import orjson
+
+from app.domain.ids import new_ordered_id
+
+from .metadata import MetadataStore, graph_name_key, project_name_key
 from .parser import parse_ursaml, serialize_ursaml
 
+# Parsed graphs kept for read-only access, keyed by graph id
+PARSED_GRAPH_CACHE_SIZE = 512
+
 
 class ProjectsRepository:
     def __init__(self, base_path: Path, metadata: MetadataStore) -> None:
@@ -17,7 +25,7 @@ class ProjectsRepository:
         self._metadata = metadata
 
     def create(self, name: str, description: str = "") -> Dict[str, Any]:
-        project_id = str(uuid.uuid4())
+        project_id = new_ordered_id()
         project = {
             'id': project_id,
             'project_id': project_id,
@@ -27,11 +35,12 @@ class ProjectsRepository:
             'graphs': []
         }
         self._metadata.data['projects'][project_id] = project
+        self._metadata.index_name(project_name_key(name), project_id)
         self._metadata.save()
-        (self.projects_path / project_id).mkdir(exist_ok=True)
-        with (self.projects_path / project_id / 'info.json').open('w', encoding='utf-8') as f:
-            import json
-            json.dump(project, f, indent=2)
+        (self.projects_path / project_id).mkdir(parents=True, exist_ok=True)
+        (self.projects_path / project_id / 'info.json').write_bytes(
+            orjson.dumps(project, option=orjson.OPT_INDENT_2)
+        )
         return project
 
     def get(self, project_id: str) -> Optional[Dict[str, Any]]:
@@ -50,12 +59,14 @@ class ProjectsRepository:
         if project_id not in self._metadata.data['projects']:
             return None
         project = self._metadata.data['projects'][project_id]
+        self._metadata.unindex_name(project_name_key(project['name']), project_id)
         project['name'] = name
         project['description'] = description
+        self._metadata.index_name(project_name_key(name), project_id)
         self._metadata.save()
-        with (self.projects_path / project_id / 'info.json').open('w', encoding='utf-8') as f:
-            import json
-            json.dump(project, f, indent=2)
+        (self.projects_path / project_id / 'info.json').write_bytes(
+            orjson.dumps(project, option=orjson.OPT_INDENT_2)
+        )
         return project
 
     def delete(self, project_id: str) -> bool:
@@ -66,6 +77,7 @@ class ProjectsRepository:
             # graphs repo should handle cascade; here we just remove metadata link
             pass
         del self._metadata.data['projects'][project_id]
+        self._metadata.unindex_name(project_name_key(project['name']), project_id)
         self._metadata.save()
         project_dir = self.projects_path / project_id
         if project_dir.exists():
@@ -78,11 +90,30 @@ class GraphsRepository:
         self.graphs_path = base_path / "graphs"
         self.graphs_path.mkdir(parents=True, exist_ok=True)
         self._metadata = metadata
+        # graph_id -> ((st_mtime_ns, st_size), parsed graph)
+        self._parsed: OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = OrderedDict()
+        self._parsed_lock = threading.Lock()
+        # graph_id -> lock held across each load/modify/save of the graph file
+        self._write_locks: Dict[str, threading.RLock] = {}
+        self._write_locks_guard = threading.Lock()
+
+    def write_lock(self, graph_id: str) -> threading.RLock:
+        """Lock serializing read-modify-write cycles on one graph's file.
+
+        Every writer that loads a graph, changes it and saves it back holds
+        this lock for the whole cycle, so concurrent writers (requests and
+        the metrics flush) cannot overwrite each other's changes.
+        """
+        with self._write_locks_guard:
+            lock = self._write_locks.get(graph_id)
+            if lock is None:
+                lock = self._write_locks[graph_id] = threading.RLock()
+            return lock
 
     def create(self, project_id: str, name: str, description: str = "") -> Optional[Dict[str, Any]]:
         if project_id not in self._metadata.data['projects']:
             return None
-        graph_id = str(uuid.uuid4())
+        graph_id = new_ordered_id()
         graph = {
             'id': graph_id,
             'graph_id': graph_id,
@@ -93,19 +124,20 @@ class GraphsRepository:
         }
         self._metadata.data['graphs'][graph_id] = graph
         self._metadata.data['projects'][project_id].setdefault('graphs', []).append(graph_id)
+        self._metadata.index_name(graph_name_key(project_id, name), graph_id)
         self._metadata.save()
 
+        # Ids lead with a millisecond timestamp; the random tail tells
+        # same-named graphs apart
         ursaml_data = {
             'version': '0.1',
-            'identifier': f"{name.replace(' ', '_')}_{graph_id[:8]}",
+            'identifier': f"{name.replace(' ', '_')}_{graph_id[-8:]}",
             'columns': ['score', 'name'],
             'column_values': {'score': [], 'name': []},
             'structure': [],
             'nodes': {}
         }
-        graph_file = self.graphs_path / f"{graph_id}.ursaml"
-        with graph_file.open('w', encoding='utf-8') as f:
-            f.write(serialize_ursaml(ursaml_data))
+        self.save_ursaml(graph_id, ursaml_data)
         return graph
 
     def get(self, graph_id: str) -> Optional[Dict[str, Any]]:
@@ -114,6 +146,12 @@ class GraphsRepository:
             graph['graph_id'] = graph['id']
         return graph
 
+    def all(self) -> List[Dict[str, Any]]:
+        items = list(self._metadata.data['graphs'].values())
+        for g in items:
+            g['graph_id'] = g['id']
+        return items
+
     def list_for_project(self, project_id: str) -> List[Dict[str, Any]]:
         graph_ids = self._metadata.data['projects'].get(project_id, {}).get('graphs', [])
         graphs = [self._metadata.data['graphs'][gid] for gid in graph_ids if gid in self._metadata.data['graphs']]
@@ -125,8 +163,10 @@ class GraphsRepository:
         if graph_id not in self._metadata.data['graphs']:
             return None
         graph = self._metadata.data['graphs'][graph_id]
+        self._metadata.unindex_name(graph_name_key(graph['project_id'], graph['name']), graph_id)
         graph['name'] = name
         graph['description'] = description
+        self._metadata.index_name(graph_name_key(graph['project_id'], name), graph_id)
         self._metadata.save()
         return graph
 
@@ -140,10 +180,16 @@ class GraphsRepository:
             if graph_id in graphs:
                 graphs.remove(graph_id)
         del self._metadata.data['graphs'][graph_id]
+        self._metadata.unindex_name(graph_name_key(project_id, graph['name']), graph_id)
         self._metadata.save()
         graph_file = self.graphs_path / f"{graph_id}.ursaml"
-        if graph_file.exists():
-            graph_file.unlink()
+        # Under the write lock, so an in-flight writer cannot re-create the file
+        with self.write_lock(graph_id):
+            if graph_file.exists():
+                graph_file.unlink()
+            self._forget_parsed(graph_id)
+        with self._write_locks_guard:
+            self._write_locks.pop(graph_id, None)
         return True
 
     def load_ursaml(self, graph_id: str) -> Optional[Dict[str, Any]]:
@@ -154,10 +200,57 @@ class GraphsRepository:
             content = f.read()
         return parse_ursaml(content)
 
+    def read_ursaml(self, graph_id: str) -> Optional[Dict[str, Any]]:
+        """Parsed graph shared between readers; callers must not mutate it.
+
+        Reuses the last parse while the file's mtime and size are unchanged,
+        so back-to-back reads skip the disk read and parse. Use
+        ``load_ursaml`` for a private copy to modify and save.
+        """
+        graph_file = self.graphs_path / f"{graph_id}.ursaml"
+        try:
+            stat = graph_file.stat()
+        except FileNotFoundError:
+            self._forget_parsed(graph_id)
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._parsed_lock:
+            cached = self._parsed.get(graph_id)
+            if cached is not None and cached[0] == key:
+                self._parsed.move_to_end(graph_id)
+                return cached[1]
+        ursaml = self.load_ursaml(graph_id)
+        if ursaml is None:
+            return None
+        with self._parsed_lock:
+            self._parsed[graph_id] = (key, ursaml)
+            self._parsed.move_to_end(graph_id)
+            if len(self._parsed) > PARSED_GRAPH_CACHE_SIZE:
+                self._parsed.popitem(last=False)
+        return ursaml
+
     def save_ursaml(self, graph_id: str, ursaml_data: Dict[str, Any]) -> None:
+        self.graphs_path.mkdir(parents=True, exist_ok=True)
         graph_file = self.graphs_path / f"{graph_id}.ursaml"
         with graph_file.open('w', encoding='utf-8') as f:
             f.write(serialize_ursaml(ursaml_data))
+        # A rewrite within the filesystem's timestamp granularity could keep
+        # the same mtime and size, so don't rely on the stat key alone
+        self._forget_parsed(graph_id)
+
+    def _forget_parsed(self, graph_id: str) -> None:
+        with self._parsed_lock:
+            self._parsed.pop(graph_id, None)
+
+
+def _node_view(graph_id: str, node_id: str, node_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': node_id,
+        'graph_id': graph_id,
+        'name': node_data['columns'].get('name', ''),
+        'model_id': node_data['detailed'].get('model_id'),
+        'metadata': node_data['detailed']
+    }
 
 
 class NodesRepository:
@@ -165,91 +258,102 @@ class NodesRepository:
         self._graphs = graphs_repo
 
     def create(self, graph_id: str, name: str, model_id: str | None = None) -> Optional[Dict[str, Any]]:
-        ursaml = self._graphs.load_ursaml(graph_id)
-        if not ursaml:
-            return None
-        node_id = f"n{len(ursaml['nodes']) + 1}"
-        node = {
-            'id': node_id,
-            'graph_id': graph_id,
-            'name': name,
-            'model_id': model_id,
-            'created_at': datetime.now().isoformat()
-        }
-        ursaml['nodes'][node_id] = {
-            'columns': {'score': 0.0, 'name': name},
-            'detailed': {'id': node_id, 'name': name, 'model_id': model_id or "", 'created_at': node['created_at']}
-        }
-        if isinstance(ursaml.get('column_values', {}).get('score'), list):
-            ursaml['column_values']['score'].append(0.0)
-        if isinstance(ursaml.get('column_values', {}).get('name'), list):
-            ursaml['column_values']['name'].append(name)
-        self._graphs.save_ursaml(graph_id, ursaml)
-        return node
+        with self._graphs.write_lock(graph_id):
+            ursaml = self._graphs.load_ursaml(graph_id)
+            if not ursaml:
+                return None
+            node_id = f"n{len(ursaml['nodes']) + 1}"
+            node = {
+                'id': node_id,
+                'graph_id': graph_id,
+                'name': name,
+                'model_id': model_id,
+                'created_at': datetime.now().isoformat()
+            }
+            ursaml['nodes'][node_id] = {
+                'columns': {'score': 0.0, 'name': name},
+                'detailed': {'id': node_id, 'name': name, 'model_id': model_id or "", 'created_at': node['created_at']}
+            }
+            if isinstance(ursaml.get('column_values', {}).get('score'), list):
+                ursaml['column_values']['score'].append(0.0)
+            if isinstance(ursaml.get('column_values', {}).get('name'), list):
+                ursaml['column_values']['name'].append(name)
+            self._graphs.save_ursaml(graph_id, ursaml)
+            return node
 
     def get(self, graph_id: str, node_id: str) -> Optional[Dict[str, Any]]:
-        ursaml = self._graphs.load_ursaml(graph_id)
+        ursaml = self._graphs.read_ursaml(graph_id)
         if not ursaml or node_id not in ursaml['nodes']:
             return None
-        node_data = ursaml['nodes'][node_id]
-        return {
-            'id': node_id,
-            'graph_id': graph_id,
-            'name': node_data['columns'].get('name', ''),
-            'model_id': node_data['detailed'].get('model_id'),
-            'metadata': node_data['detailed']
-        }
+        return _node_view(graph_id, node_id, ursaml['nodes'][node_id])
 
     def update(self, graph_id: str, node_id: str, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        ursaml = self._graphs.load_ursaml(graph_id)
-        if not ursaml or node_id not in ursaml['nodes']:
-            return None
-        ursaml['nodes'][node_id]['detailed'].update(metadata)
-        self._graphs.save_ursaml(graph_id, ursaml)
-        return self.get(graph_id, node_id)
+        with self._graphs.write_lock(graph_id):
+            ursaml = self._graphs.load_ursaml(graph_id)
+            if not ursaml or node_id not in ursaml['nodes']:
+                return None
+            ursaml['nodes'][node_id]['detailed'].update(metadata)
+            self._graphs.save_ursaml(graph_id, ursaml)
+        # Build the result from the graph already in memory rather than re-reading it
+        return _node_view(graph_id, node_id, ursaml['nodes'][node_id])
 
     def delete(self, graph_id: str, node_id: str) -> bool:
-        ursaml = self._graphs.load_ursaml(graph_id)
-        if not ursaml or node_id not in ursaml['nodes']:
-            return False
-        del ursaml['nodes'][node_id]
-        ursaml['structure'] = [edge for edge in ursaml['structure'] if edge[0] != node_id and edge[1] != node_id]
-        self._graphs.save_ursaml(graph_id, ursaml)
+        with self._graphs.write_lock(graph_id):
+            ursaml = self._graphs.load_ursaml(graph_id)
+            if not ursaml or node_id not in ursaml['nodes']:
+                return False
+            del ursaml['nodes'][node_id]
+            ursaml['structure'] = [edge for edge in ursaml['structure'] if edge[0] != node_id and edge[1] != node_id]
+            self._graphs.save_ursaml(graph_id, ursaml)
         return True
 
     def list_for_graph(self, graph_id: str) -> List[Dict[str, Any]]:
-        ursaml = self._graphs.load_ursaml(graph_id)
+        ursaml = self._graphs.read_ursaml(graph_id)
         if not ursaml:
             return []
-        nodes: List[Dict[str, Any]] = []
-        for node_id, node_data in ursaml['nodes'].items():
-            nodes.append({
-                'id': node_id,
-                'graph_id': graph_id,
-                'name': node_data['columns'].get('name', ''),
-                'model_id': node_data['detailed'].get('model_id'),
-                'metadata': node_data['detailed']
-            })
-        return nodes
+        return [_node_view(graph_id, node_id, node_data) for node_id, node_data in ursaml['nodes'].items()]
 
-    def create_edge(self, graph_id: str, source_id: str, target_id: str, edge_type: str = "default", weight: float = 1.0) -> bool:
-        ursaml = self._graphs.load_ursaml(graph_id)
+    def metrics_for_graph(self, graph_id: str) -> Dict[str, Dict[str, Any]]:
+        ursaml = self._graphs.read_ursaml(graph_id)
         if not ursaml:
-            return False
-        if source_id not in ursaml['nodes'] or target_id not in ursaml['nodes']:
-            return False
-        ursaml['structure'].append((source_id, target_id, weight, edge_type))
-        self._graphs.save_ursaml(graph_id, ursaml)
+            return {}
+        # Latest metrics per node straight from one parse, without building node views
+        return {
+            node_id: node_data['detailed'].get('meta', {})
+            for node_id, node_data in ursaml['nodes'].items()
+        }
+
+    def create_edge(self, graph_id: str, source_id: str, target_id: str, edge_type: str = "default", weight: float = 1.0) -> bool:
+        with self._graphs.write_lock(graph_id):
+            ursaml = self._graphs.load_ursaml(graph_id)
+            if not ursaml:
+                return False
+            if source_id not in ursaml['nodes'] or target_id not in ursaml['nodes']:
+                return False
+            ursaml['structure'].append((source_id, target_id, weight, edge_type))
+            self._graphs.save_ursaml(graph_id, ursaml)
         return True
 
     def list_edges(self, graph_id: str) -> List[Dict[str, Any]]:
-        ursaml = self._graphs.load_ursaml(graph_id)
+        ursaml = self._graphs.read_ursaml(graph_id)
         if not ursaml:
             return []
-        edges: List[Dict[str, Any]] = []
-        for source, target, weight, edge_type in ursaml['structure']:
-            edges.append({'source_id': source, 'target_id': target, 'weight': weight, 'type': edge_type, 'graph_id': graph_id})
-        return edges
+        return _edge_views(graph_id, ursaml)
+
+    def structure_for_graph(self, graph_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        # Nodes and edges from the same read, so they describe one version of the graph
+        ursaml = self._graphs.read_ursaml(graph_id)
+        if not ursaml:
+            return [], []
+        nodes = [_node_view(graph_id, node_id, node_data) for node_id, node_data in ursaml['nodes'].items()]
+        return nodes, _edge_views(graph_id, ursaml)
+
+
+def _edge_views(graph_id: str, ursaml: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {'source_id': source, 'target_id': target, 'weight': weight, 'type': edge_type, 'graph_id': graph_id}
+        for source, target, weight, edge_type in ursaml['structure']
+    ]
 
 
 class ModelsRepository:
@@ -269,9 +373,7 @@ class ModelsRepository:
             "path": str(file_path),
             "artifacts": {"model": {"path": str(file_path), "type": "unknown"}},
         }
-        with (model_dir / "metadata.json").open('w', encoding='utf-8') as f:
-            import json
-            json.dump(metadata, f, indent=2)
+        (model_dir / "metadata.json").write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
         return str(file_path)
 
     def get(self, model_id: str) -> Optional[bytes]:
@@ -279,9 +381,7 @@ class ModelsRepository:
         if not model_dir.exists():
             return None
         try:
-            import json
-            with (model_dir / "metadata.json").open('r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = orjson.loads((model_dir / "metadata.json").read_bytes())
             if "path" in metadata:
                 model_path = Path(metadata["path"])
                 if not model_path.exists():
@@ -1,22 +1,31 @@
 """
 UrsaML Storage - Composed façade delegating to repositories for projects, graphs, nodes, models.
 """
-import json
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import shutil
 
+import orjson
+
 from .repositories import ProjectsRepository, GraphsRepository, NodesRepository, ModelsRepository
-from .metadata import MetadataStore
+from .metadata import MetadataStore, graph_name_key, project_name_key
 from .parser import parse_ursaml, serialize_ursaml
 from app.domain.specifications import Specification, filter_by_specification
 
 
+# Number of projects whose encoded graph listing is kept
+_GRAPH_LIST_CACHE_SIZE = 256
+
+
 class UrsaMLStorage:
     """File-based storage using UrsaML format, composed of repositories."""
     
-    def __init__(self, base_path: str = "data/ursaml"):
+    def __init__(self, base_path: str | Path = "data/ursaml"):
         self.base_path = Path(base_path)
         self.projects_path = self.base_path / "projects"
         self.graphs_path = self.base_path / "graphs"
@@ -35,6 +44,11 @@ class UrsaMLStorage:
         self._nodes = NodesRepository(self._graphs)
         self._models = ModelsRepository(self.base_path)
 
+        # Encoded graph listings per project, tagged with the metadata
+        # revision they were built from; any metadata change makes them stale
+        self._graph_list_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._graph_list_lock = threading.Lock()
+
     # Compatibility helpers for health checks/tests
     def _load_metadata(self) -> Dict[str, Any]:
         return self._metadata.data
@@ -46,7 +60,8 @@ class UrsaMLStorage:
 
     # Project operations
     def create_project(self, name: str, description: str = "") -> Dict[str, Any]:
-        return self._projects.create(name, description)
+        with self._metadata.unit_of_work():
+            return self._projects.create(name, description)
 
     def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         return self._projects.get(project_id)
@@ -55,31 +70,78 @@ class UrsaMLStorage:
         return self._projects.all()
 
     def update_project(self, project_id: str, name: str, description: str) -> Optional[Dict[str, Any]]:
-        return self._projects.update(project_id, name, description)
+        with self._metadata.unit_of_work():
+            return self._projects.update(project_id, name, description)
+
+    def project_name_exists(self, name: str, exclude_id: str = None) -> bool:
+        """Case-insensitive indexed check for another project with this name."""
+        ids = self._metadata.ids_with_name(project_name_key(name))
+        return any(project_id != exclude_id for project_id in ids)
 
     def delete_project(self, project_id: str) -> bool:
         project = self._projects.get(project_id)
         if not project:
             return False
-        for graph_id in project.get('graphs', []):
-            self.delete_graph(graph_id)
-        return self._projects.delete(project_id)
+        with self._metadata.unit_of_work():
+            # Copy: delete_graph removes each id from this list
+            for graph_id in list(project.get('graphs', [])):
+                self.delete_graph(graph_id)
+            return self._projects.delete(project_id)
 
     # Graph operations
     def create_graph(self, project_id: str, name: str, description: str = "") -> Optional[Dict[str, Any]]:
-        return self._graphs.create(project_id, name, description)
+        with self._metadata.unit_of_work():
+            return self._graphs.create(project_id, name, description)
 
     def get_graph(self, graph_id: str) -> Optional[Dict[str, Any]]:
         return self._graphs.get(graph_id)
 
+    def get_all_graphs(self) -> List[Dict[str, Any]]:
+        return self._graphs.all()
+
     def get_project_graphs(self, project_id: str) -> List[Dict[str, Any]]:
         return self._graphs.list_for_project(project_id)
 
     def update_graph(self, graph_id: str, name: str, description: str) -> Optional[Dict[str, Any]]:
-        return self._graphs.update(graph_id, name, description)
+        with self._metadata.unit_of_work():
+            return self._graphs.update(graph_id, name, description)
 
     def delete_graph(self, graph_id: str) -> bool:
-        return self._graphs.delete(graph_id)
+        with self._metadata.unit_of_work():
+            return self._graphs.delete(graph_id)
+
+    def get_project_graphs_json(self, project_id: str) -> bytes:
+        """JSON array of a project's graphs in API response shape, cached per metadata revision."""
+        # Read the revision before the graphs so a concurrent change can only
+        # make the cached body look stale, never fresh
+        revision = self._metadata.revision
+        with self._graph_list_lock:
+            cached = self._graph_list_cache.get(project_id)
+            if cached is not None and cached[0] == revision:
+                self._graph_list_cache.move_to_end(project_id)
+                return cached[1]
+
+        body = orjson.dumps([
+            {
+                "graph_id": graph["id"],
+                "name": graph["name"],
+                "description": graph.get("description", ""),
+                "project_id": project_id,
+                "created_at": graph["created_at"],
+            }
+            for graph in self._graphs.list_for_project(project_id)
+        ])
+        with self._graph_list_lock:
+            self._graph_list_cache[project_id] = (revision, body)
+            self._graph_list_cache.move_to_end(project_id)
+            if len(self._graph_list_cache) > _GRAPH_LIST_CACHE_SIZE:
+                self._graph_list_cache.popitem(last=False)
+        return body
+
+    def graph_name_exists(self, project_id: str, name: str, exclude_id: str = None) -> bool:
+        """Case-insensitive indexed check for another graph with this name in a project."""
+        ids = self._metadata.ids_with_name(graph_name_key(project_id, name))
+        return any(graph_id != exclude_id for graph_id in ids)
 
     def load_graph_ursaml(self, graph_id: str) -> Optional[Dict[str, Any]]:
         return self._graphs.load_ursaml(graph_id)
@@ -87,6 +149,10 @@ class UrsaMLStorage:
     def save_graph_ursaml(self, graph_id: str, ursaml_data: Dict[str, Any]):
         return self._graphs.save_ursaml(graph_id, ursaml_data)
 
+    def graph_write_lock(self, graph_id: str) -> threading.RLock:
+        """Lock to hold across a load_graph_ursaml/save_graph_ursaml cycle."""
+        return self._graphs.write_lock(graph_id)
+
     # Node operations
     def create_node(self, graph_id: str, name: str, model_id: str = None) -> Optional[Dict[str, Any]]:
         return self._nodes.create(graph_id, name, model_id)
@@ -103,6 +169,10 @@ class UrsaMLStorage:
     def get_graph_nodes(self, graph_id: str) -> List[Dict[str, Any]]:
         return self._nodes.list_for_graph(graph_id)
 
+    def get_graph_metrics(self, graph_id: str) -> Dict[str, Dict[str, Any]]:
+        """Latest recorded metrics for every node in a graph, keyed by node id."""
+        return self._nodes.metrics_for_graph(graph_id)
+
     def create_edge(self, graph_id: str, source_id: str, target_id: str, 
                     edge_type: str = "default", weight: float = 1.0) -> bool:
         return self._nodes.create_edge(graph_id, source_id, target_id, edge_type, weight)
@@ -110,6 +180,10 @@ class UrsaMLStorage:
     def get_graph_edges(self, graph_id: str) -> List[Dict[str, Any]]:
         return self._nodes.list_edges(graph_id)
 
+    def get_graph_structure(self, graph_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """A graph's nodes and edges from a single read."""
+        return self._nodes.structure_for_graph(graph_id)
+
     # Model operations
     def save_model(self, model_data: bytes, model_id: str) -> str:
         return self._models.save(model_data, model_id)
@@ -145,17 +219,12 @@ class UrsaMLStorage:
     
     def find_graphs(self, spec: Specification) -> List[Dict[str, Any]]:
         """Find graphs matching a specification."""
-        # Get all graphs across all projects
-        all_graphs = []
-        for project in self.get_all_projects():
-            all_graphs.extend(self.get_project_graphs(project["id"]))
-        return filter_by_specification(all_graphs, spec)
+        return filter_by_specification(self.get_all_graphs(), spec)
     
     def find_nodes(self, spec: Specification) -> List[Dict[str, Any]]:
         """Find nodes matching a specification."""
-        # Get all nodes across all graphs
+        # Get all nodes across all graphs in one pass over the graph index
         all_nodes = []
-        for project in self.get_all_projects():
-            for graph in self.get_project_graphs(project["id"]):
-                all_nodes.extend(self.get_graph_nodes(graph["id"]))
+        for graph in self.get_all_graphs():
+            all_nodes.extend(self.get_graph_nodes(graph["id"]))
         return filter_by_specification(all_nodes, spec)
\ No newline at end of file
@@ -12,6 +12,7 @@ from app.main import app
 from app.ursaml import UrsaMLStorage
 from app.config import Settings, REPO_ROOT
 from app.services.cache.cache_manager import ModelCacheManager
+from app.services.cache.local_cache import LocalCacheRepository
 from app.dependencies import get_cache_manager
 
 
@@ -130,6 +131,30 @@ def test_cache_service(test_settings):
     clean_dir_keep_gitkeep(cache_root)
 
 
+@pytest.fixture
+def make_cache_manager(tmp_path):
+    """Factory for a ModelCacheManager with mocked collaborators.
+
+    Defaults: a LocalCacheRepository under tmp_path, a policy reporting
+    every model cached and fresh, and S3 disabled; pass any to override.
+    """
+    def _make(local_cache=None, metadata_store=None, sdk_workspace=None,
+              policy=None, s3_gateway=None, s3_enabled=False):
+        if policy is None:
+            policy = Mock()
+            policy.is_cached.return_value = True
+            policy.is_fresh.return_value = True
+        return ModelCacheManager(
+            local_cache=local_cache or LocalCacheRepository(tmp_path / "cache"),
+            metadata_store=metadata_store or Mock(),
+            sdk_workspace=sdk_workspace or Mock(),
+            policy=policy,
+            s3_gateway=s3_gateway or Mock(),
+            s3_enabled=s3_enabled,
+        )
+    return _make
+
+
 @pytest.fixture
 def sample_sklearn_model():
     """Create a simple sklearn model for testing."""
@@ -268,6 +268,22 @@ class TestModelEndpoints:
         assert data["model_id"] is not None
         assert data["node_id"] is not None
     
+    def test_upload_model_binary(self, client, sample_project, sample_graph, sample_sklearn_model):
+        """Test model upload with a raw octet-stream body."""
+        model, X, y = sample_sklearn_model
+        
+        response = client.post(
+            "/models/binary",
+            params={"graph_id": sample_graph["graph_id"]},
+            content=pickle.dumps(model),
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        assert response.status_code == 201
+        
+        data = response.json()
+        assert data["model_id"] is not None
+        assert data["node_id"] is not None
+    
     def test_get_model_details(self, client, sample_project, sample_graph, sample_sklearn_model):
         """Test getting model details."""
         model, X, y = sample_sklearn_model
@@ -1,8 +1,10 @@
 """Tests for application services."""
 from __future__ import annotations
 
+import io
+import threading
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
 
 from app.services.model_app_service import ModelAppService
@@ -13,6 +15,7 @@ from app.application.metrics_service import MetricsService
 from app.domain.errors import ValidationError, NotFoundError, ConflictError
 from app.domain.events import ModelUploaded, MetricsRecorded
 from app.infrastructure.model_ingestion_adapter import ModelIngestionAdapter
+from app.ursaml import UrsaMLStorage
 
 
 class TestModelAppService:
@@ -79,9 +82,55 @@ class TestModelAppService:
         # Verify calls
         mock_storage.get_graph.assert_called_once_with("graph-123")
         mock_ingestion.prepare.assert_called_once_with("base64data")
-        mock_cache.save_model_from_sdk.assert_called_once()
+        mock_cache.save_model_from_sdk.assert_called_once_with("model-789", Path("/tmp/sdk"), move=True)
         mock_storage.create_node.assert_called_once()
 
+    def test_upload_model_bytes_skips_base64(self):
+        """Test raw byte uploads go straight to prepare_bytes."""
+        mock_storage = Mock()
+        mock_storage.get_graph.return_value = {"id": "graph-123"}
+        mock_storage.create_node.return_value = {"id": "node-456"}
+        mock_cache = Mock()
+        mock_ingestion = Mock()
+        mock_ingestion.prepare_bytes.return_value = Mock(
+            model_id="model-789",
+            model_name="test-model",
+            created_at="2024-01-01T00:00:00",
+            sdk_dir=Path("/tmp/sdk"),
+        )
+        
+        service = ModelAppService(mock_storage, mock_cache, mock_ingestion)
+        result = service.upload_model_bytes(b"\x80\x04raw", "graph-123")
+        
+        assert result["model_id"] == "model-789"
+        mock_ingestion.prepare_bytes.assert_called_once_with(b"\x80\x04raw")
+        mock_ingestion.prepare.assert_not_called()
+
+        with pytest.raises(ValidationError, match="Model file data is required"):
+            service.upload_model_bytes(b"", "graph-123")
+
+    def test_upload_model_stream_reads_from_file(self):
+        """Test stream uploads are handed to prepare_stream rewound to the start."""
+        mock_storage = Mock()
+        mock_storage.get_graph.return_value = {"id": "graph-123"}
+        mock_storage.create_node.return_value = {"id": "node-456"}
+        mock_ingestion = Mock()
+        mock_ingestion.prepare_stream.side_effect = lambda stream: Mock(
+            model_id="model-789",
+            model_name=stream.read().decode(),
+            created_at="2024-01-01T00:00:00",
+            sdk_dir=Path("/tmp/sdk"),
+        )
+        
+        service = ModelAppService(mock_storage, Mock(), mock_ingestion)
+        result = service.upload_model_stream(io.BytesIO(b"payload"), "graph-123")
+        
+        assert result["model_id"] == "model-789"
+        assert result["name"] == "payload"
+
+        with pytest.raises(ValidationError, match="Model file data is required"):
+            service.upload_model_stream(io.BytesIO(b""), "graph-123")
+
     def test_upload_model_node_creation_rollback(self):
         """Test rollback when node creation fails."""
         # Setup
@@ -134,42 +183,31 @@ class TestProjectValidationService:
     def test_check_duplicate_name_no_duplicates(self):
         """Test no duplicate names found."""
         mock_storage = Mock()
-        mock_storage.get_all_projects.return_value = [
-            {"id": "proj-1", "name": "Project A"},
-            {"id": "proj-2", "name": "Project B"},
-        ]
+        mock_storage.project_name_exists.return_value = False
         service = ProjectValidationService(mock_storage)
         
         # Should not raise
         service.check_duplicate_name("Project C")
+        mock_storage.project_name_exists.assert_called_once_with("Project C", exclude_id=None)
 
     def test_check_duplicate_name_conflict(self):
         """Test duplicate name conflict."""
         mock_storage = Mock()
-        mock_storage.get_all_projects.return_value = [
-            {"id": "proj-1", "name": "Project A"},
-            {"id": "proj-2", "name": "Project B"},
-        ]
+        mock_storage.project_name_exists.return_value = True
         service = ProjectValidationService(mock_storage)
         
         with pytest.raises(ConflictError, match="Project with name 'Project A' already exists"):
             service.check_duplicate_name("Project A")
-        
-        # Case insensitive
-        with pytest.raises(ConflictError, match="Project with name 'project a' already exists"):
-            service.check_duplicate_name("project a")
 
     def test_check_duplicate_name_exclude_id(self):
         """Test duplicate check with exclude ID."""
         mock_storage = Mock()
-        mock_storage.get_all_projects.return_value = [
-            {"id": "proj-1", "name": "Project A"},
-            {"id": "proj-2", "name": "Project B"},
-        ]
+        mock_storage.project_name_exists.return_value = False
         service = ProjectValidationService(mock_storage)
         
         # Should not raise when excluding the same ID
         service.check_duplicate_name("Project A", exclude_id="proj-1")
+        mock_storage.project_name_exists.assert_called_once_with("Project A", exclude_id="proj-1")
 
 
 class TestGraphValidationService:
@@ -195,23 +233,18 @@ class TestGraphValidationService:
         """Test no duplicate names in project."""
         mock_storage = Mock()
         mock_storage.get_project.return_value = {"id": "proj-1", "name": "Test Project"}
-        mock_storage.get_project_graphs.return_value = [
-            {"id": "graph-1", "name": "Graph A"},
-            {"id": "graph-2", "name": "Graph B"},
-        ]
+        mock_storage.graph_name_exists.return_value = False
         service = GraphValidationService(mock_storage)
         
         # Should not raise
         service.check_duplicate_name_in_project("proj-1", "Graph C")
+        mock_storage.graph_name_exists.assert_called_once_with("proj-1", "Graph C", exclude_id=None)
 
     def test_check_duplicate_name_in_project_conflict(self):
         """Test duplicate name conflict in project."""
         mock_storage = Mock()
         mock_storage.get_project.return_value = {"id": "proj-1", "name": "Test Project"}
-        mock_storage.get_project_graphs.return_value = [
-            {"id": "graph-1", "name": "Graph A"},
-            {"id": "graph-2", "name": "Graph B"},
-        ]
+        mock_storage.graph_name_exists.return_value = True
         service = GraphValidationService(mock_storage)
         
         with pytest.raises(ConflictError, match="Graph with name 'Graph A' already exists"):
@@ -240,8 +273,11 @@ class TestGraphAccessService:
         }
         service = GraphAccessService(mock_storage)
         
-        # Should not raise
-        service.require_graph_in_project("proj-456", "graph-123")
+        # Should not raise, and hands back the graph it loaded
+        graph = service.require_graph_in_project("proj-456", "graph-123")
+        assert graph["name"] == "Test Graph"
+        mock_storage.get_graph.assert_called_once_with("graph-123")
+        mock_storage.get_project.assert_not_called()
 
     def test_require_graph_in_project_graph_not_found(self):
         """Test error when graph doesn't exist."""
@@ -252,6 +288,16 @@ class TestGraphAccessService:
         with pytest.raises(NotFoundError, match="Graph not found"):
             service.require_graph_in_project("proj-456", "nonexistent-graph")
 
+    def test_require_graph_in_project_project_not_found(self):
+        """Test missing project is reported when the graph is also missing."""
+        mock_storage = Mock()
+        mock_storage.get_graph.return_value = None
+        mock_storage.get_project.return_value = None
+        service = GraphAccessService(mock_storage)
+        
+        with pytest.raises(NotFoundError, match="Project not found"):
+            service.require_graph_in_project("nonexistent", "graph-123")
+
     def test_require_graph_in_project_wrong_ownership(self):
         """Test error when graph belongs to different project."""
         mock_storage = Mock()
@@ -265,6 +311,20 @@ class TestGraphAccessService:
         with pytest.raises(ValidationError, match="Graph does not belong to specified project"):
             service.require_graph_in_project("proj-789", "graph-123")
 
+    def test_require_graph_in_project_missing_project_before_ownership(self):
+        """Test a missing project is reported even when the graph exists elsewhere."""
+        mock_storage = Mock()
+        mock_storage.get_graph.return_value = {
+            "id": "graph-123",
+            "project_id": "proj-456",
+            "name": "Test Graph"
+        }
+        mock_storage.get_project.return_value = None
+        service = GraphAccessService(mock_storage)
+        
+        with pytest.raises(NotFoundError, match="Project not found"):
+            service.require_graph_in_project("nonexistent", "graph-123")
+
 
 class TestMetricsService:
     """Test MetricsService metrics logic."""
@@ -280,3 +340,115 @@ class TestMetricsService:
         
         assert result == {"status": "success"}
         mock_storage.add_metrics.assert_called_once_with("graph-123", "node-456", metrics)
+
+    def test_metrics_timestamp_is_iso_format(self):
+        """Test cached timestamp formatter produces parseable ISO timestamps."""
+        from datetime import datetime
+        from app.application.metrics_service import _metrics_timestamp
+
+        before = datetime.now().replace(microsecond=0)
+        parsed = datetime.fromisoformat(_metrics_timestamp())
+
+        assert parsed >= before
+
+    def test_add_node_metrics_coalesces_writes(self):
+        """Test staged metrics for one graph are written with a single save."""
+        mock_storage = MagicMock()
+        mock_storage.load_graph_ursaml.return_value = {
+            "nodes": {
+                "n1": {"columns": {"score": 0.0, "name": "a"}, "detailed": {}},
+                "n2": {"columns": {"score": 0.0, "name": "b"}, "detailed": {}},
+            }
+        }
+        service = MetricsService(mock_storage, flush_interval=60.0)
+
+        service.add_node_metrics("graph-123", "n1", {"accuracy": 0.9, "loss": 0.1})
+        service.add_node_metrics("graph-123", "n2", {"accuracy": 0.8, "f1": 0.7})
+        mock_storage.save_graph_ursaml.assert_not_called()
+
+        service.flush()
+
+        mock_storage.save_graph_ursaml.assert_called_once()
+        graph_id, saved = mock_storage.save_graph_ursaml.call_args[0]
+        assert graph_id == "graph-123"
+        assert saved["nodes"]["n1"]["columns"]["score"] == 0.9
+        assert saved["nodes"]["n1"]["detailed"]["meta"]["loss"] == 0.1
+        assert saved["nodes"]["n2"]["detailed"]["meta"]["f1"] == 0.7
+
+    def test_flush_does_not_overwrite_concurrent_node_create(self, tmp_path):
+        """Test a node created while a flush holds the graph is kept on disk."""
+        storage = UrsaMLStorage(base_path=tmp_path)
+        project = storage.create_project("p")
+        graph = storage.create_graph(project["id"], "g")
+        storage.create_node(graph["id"], "first")
+        service = MetricsService(storage, flush_interval=60.0)
+        service.add_node_metrics(graph["id"], "n1", {"accuracy": 0.9})
+
+        creator = threading.Thread(target=storage.create_node, args=(graph["id"], "second"))
+        load = storage.load_graph_ursaml
+
+        def load_then_race(graph_id):
+            ursaml = load(graph_id)
+            if threading.current_thread() is threading.main_thread() and not creator.is_alive():
+                creator.start()
+                # The create has to wait for the flush's save
+                creator.join(timeout=0.2)
+            return ursaml
+
+        with patch.object(storage, "load_graph_ursaml", side_effect=load_then_race):
+            service.flush()
+        creator.join(timeout=5)
+
+        nodes = storage.load_graph_ursaml(graph["id"])["nodes"]
+        assert sorted(nodes) == ["n1", "n2"]
+        assert nodes["n1"]["detailed"]["meta"]["score"] == 0.9
+
+    def test_flush_restages_batch_when_write_fails(self):
+        """Test metrics survive a failed write and go out on the next flush."""
+        mock_storage = MagicMock()
+        mock_storage.load_graph_ursaml.side_effect = lambda graph_id: {
+            "nodes": {"n1": {"columns": {"score": 0.0}, "detailed": {}}}
+        }
+        mock_storage.save_graph_ursaml.side_effect = [OSError("disk full"), None]
+        service = MetricsService(mock_storage, flush_interval=60.0)
+
+        service.add_node_metrics("graph-123", "n1", {"accuracy": 0.9, "f1": 0.5})
+        service.flush()
+        service.add_node_metrics("graph-123", "n1", {"accuracy": 0.95})
+        service.flush()
+
+        assert mock_storage.save_graph_ursaml.call_count == 2
+        _, saved = mock_storage.save_graph_ursaml.call_args[0]
+        meta = saved["nodes"]["n1"]["detailed"]["meta"]
+        # Newer values win; keys only in the failed batch are kept
+        assert saved["nodes"]["n1"]["columns"]["score"] == 0.95
+        assert meta["score"] == 0.95
+        assert meta["f1"] == 0.5
+
+    def test_discard_drops_staged_metrics_for_deleted_node(self):
+        """Test metrics staged for a deleted node are not written on flush."""
+        mock_storage = Mock()
+        mock_storage.load_graph_ursaml.return_value = {
+            "nodes": {"n1": {"columns": {"score": 0.0}, "detailed": {}}}
+        }
+        service = MetricsService(mock_storage, flush_interval=60.0)
+
+        service.add_node_metrics("graph-123", "n1", {"accuracy": 0.9})
+        service.discard("graph-123", "n1")
+        service.flush()
+
+        mock_storage.save_graph_ursaml.assert_not_called()
+
+        # The deleted node is looked up again rather than trusted from cache
+        mock_storage.load_graph_ursaml.return_value = {"nodes": {}}
+        with pytest.raises(NotFoundError):
+            service.add_node_metrics("graph-123", "n1", {"accuracy": 0.9})
+
+    def test_add_node_metrics_node_not_found(self):
+        """Test unknown nodes are rejected before anything is staged."""
+        mock_storage = Mock()
+        mock_storage.load_graph_ursaml.return_value = {"nodes": {}}
+        service = MetricsService(mock_storage, flush_interval=60.0)
+
+        with pytest.raises(NotFoundError, match="Node n9 not found"):
+            service.add_node_metrics("graph-123", "n9", {"accuracy": 0.9})
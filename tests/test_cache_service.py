@@ -9,6 +9,9 @@ from unittest.mock import patch, Mock
 import pytest
 
 from app.services.cache.cache_manager import ModelCacheManager
+from app.services.cache.local_cache import LocalCacheRepository
+from app.services.cache.s3_gateway import ModelS3Gateway
+from app.services.cache.sdk_workspace import SDKWorkspaceManager
 from app.dependencies import get_cache_manager
 from ursakit.client import UrsaClient
 from app.config import settings, REPO_ROOT
@@ -112,6 +115,105 @@ class TestModelCacheService:
         with pytest.raises(ValueError):
             test_cache_service.get_model_for_sdk("non-existent")
     
+    def test_delete_model_removes_local_and_remote(self, make_cache_manager):
+        """Test delete clears local state and tolerates a failing remote delete."""
+        local, meta, s3 = Mock(), Mock(), Mock()
+        s3.delete.side_effect = RuntimeError("network down")
+        manager = make_cache_manager(
+            local_cache=local, metadata_store=meta, s3_gateway=s3, s3_enabled=True
+        )
+        
+        assert manager.delete_model("model-1") is True
+        local.remove_model_dir.assert_called_once_with("model-1")
+        meta.remove.assert_called_once_with("model-1")
+        s3.delete.assert_called_once_with("model-1")
+    
+    def test_remote_status_pings_bucket(self, make_cache_manager):
+        """Test S3 reachability is checked with a bucket HEAD."""
+        client = Mock()
+        manager = make_cache_manager(
+            s3_gateway=ModelS3Gateway(client, "bucket"), s3_enabled=True
+        )
+        
+        assert manager.remote_status() == "reachable"
+        client.head_bucket.assert_called_once_with(Bucket="bucket")
+        client.list_objects_v2.assert_not_called()
+        
+        client.head_bucket.side_effect = RuntimeError("network down")
+        assert manager.remote_status() == "unreachable"
+    
+    def test_save_model_from_sdk_move(self, tmp_path, make_cache_manager):
+        """Test move=True relocates the SDK model directory instead of copying it."""
+        sdk_model_dir = tmp_path / "sdk" / "models" / "model-1"
+        sdk_model_dir.mkdir(parents=True)
+        (sdk_model_dir / "model.pkl").write_bytes(b"data")
+        manager = make_cache_manager()
+        
+        cache_dir = manager.save_model_from_sdk("model-1", tmp_path / "sdk", move=True)
+        
+        assert (cache_dir / "model.pkl").read_bytes() == b"data"
+        assert not sdk_model_dir.exists()
+    
+    def test_read_model_metadata_reuses_parse_until_rewritten(self, tmp_path):
+        """Test metadata.json is parsed once while the file is unchanged."""
+        local = LocalCacheRepository(tmp_path / "cache")
+        local.write_model_metadata("model-1", {"framework": "sklearn"})
+        
+        first = local.read_model_metadata("model-1")
+        assert local.read_model_metadata("model-1") is first
+        
+        local.write_model_metadata("model-1", {"framework": "pytorch", "extra": True})
+        assert local.read_model_metadata("model-1")["framework"] == "pytorch"
+        assert local.read_model_metadata("missing") is None
+    
+    def test_get_metadata_skips_sdk_workspace(self, tmp_path, make_cache_manager):
+        """Test metadata is read from the cache without preparing a workspace."""
+        local = LocalCacheRepository(tmp_path / "cache")
+        local.write_model_metadata("model-1", {"framework": "sklearn"})
+        sdk_workspace = Mock()
+        manager = make_cache_manager(local_cache=local, sdk_workspace=sdk_workspace)
+        
+        assert manager.get_metadata("model-1")["framework"] == "sklearn"
+        sdk_workspace.create_workspace.assert_not_called()
+        
+        manager.delete_model("model-1")
+        with pytest.raises(ValueError):
+            manager.get_metadata("model-1")
+    
+    def test_resolve_model_file_returns_path_and_metadata(self, tmp_path, make_cache_manager):
+        """Test the cached artifact is resolved in place along with its metadata."""
+        local = LocalCacheRepository(tmp_path / "cache")
+        cache_dir = local.ensure_model_dir("model-1")
+        (cache_dir / "model.pkl").write_bytes(b"data")
+        local.write_model_metadata("model-1", {"path": "model.pkl", "framework": "sklearn"})
+        manager = make_cache_manager(local_cache=local)
+        
+        model_file, metadata = manager.resolve_model_file("model-1")
+        
+        assert model_file == cache_dir / "model.pkl"
+        assert metadata["framework"] == "sklearn"
+    
+    def test_get_model_for_sdk_links_artifacts(self, tmp_path, make_cache_manager):
+        """Test workspace artifacts are hardlinked and cache metadata is left intact."""
+        local = LocalCacheRepository(tmp_path / "cache")
+        cache_dir = local.ensure_model_dir("model-1")
+        (cache_dir / "model.pkl").write_bytes(b"data")
+        local.write_model_metadata("model-1", {"path": "model.pkl", "framework": "sklearn"})
+        manager = make_cache_manager(
+            local_cache=local, sdk_workspace=SDKWorkspaceManager(tmp_path / "sdk")
+        )
+        
+        workspace = manager.get_model_for_sdk("model-1")
+        
+        staged = workspace / "models" / "model-1"
+        assert (staged / "model.pkl").samefile(cache_dir / "model.pkl")
+        assert json.loads((staged / "metadata.json").read_text())["path"] == str(staged / "model.pkl")
+        assert json.loads((cache_dir / "metadata.json").read_text())["path"] == "model.pkl"
+        
+        manager.release_sdk_workspace(workspace)
+        assert not workspace.exists()
+        assert (cache_dir / "model.pkl").read_bytes() == b"data"
+    
     def test_cache_metadata_persistence(self, test_cache_service, sample_sklearn_model):
         """Test that cache metadata persists across service instances."""
         model, X, y = sample_sklearn_model
@@ -1,6 +1,8 @@
 """Tests for domain events and event handling."""
 from __future__ import annotations
 
+import logging
+import threading
 import pytest
 from unittest.mock import Mock
 from datetime import datetime
@@ -55,6 +57,14 @@ class TestDomainEvent:
         assert isinstance(event.timestamp, datetime)
 
 
+    def test_events_are_slotted(self):
+        """Test events carry no per-instance __dict__."""
+        event = MetricsRecorded.for_node("graph-1", "node-1", {"accuracy": 0.9})
+        
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = "value"
+
 class TestModelUploadedEvent:
     """Test ModelUploaded domain event."""
 
@@ -115,6 +125,18 @@ class TestMetricsRecordedEvent:
         assert event.metrics == metrics
         assert event.aggregate_id == "node-456"  # Should be set to node_id
 
+    def test_metrics_recorded_for_node(self):
+        """Test the factory fills identity fields from the node."""
+        metrics = {"accuracy": 0.95}
+        event = MetricsRecorded.for_node("graph-123", "node-456", metrics)
+
+        assert event.event_id
+        assert isinstance(event.timestamp, datetime)
+        assert event.aggregate_id == "node-456"
+        assert event.graph_id == "graph-123"
+        assert event.node_id == "node-456"
+        assert event.metrics == metrics
+
     def test_metrics_recorded_to_dict(self):
         """Test MetricsRecorded event serialization."""
         metrics = {"accuracy": 0.95, "loss": 0.05}
@@ -267,6 +289,153 @@ class TestDomainEventPublisher:
         metrics_handler.assert_called_once_with(metrics_event)
 
 
+    def test_bulk_subscribe_freezes_handler_chain(self):
+        """Test bulk subscription stores handlers as an ordered tuple."""
+        publisher = DomainEventPublisher()
+        publisher.clear_subscribers()
+        handler1 = Mock()
+        handler2 = Mock()
+
+        publisher.bulk_subscribe({ModelDeleted: [handler1, handler2]})
+
+        assert publisher._subscribers[ModelDeleted] == (handler1, handler2)
+
+        event = ModelDeleted(
+            event_id="e1",
+            timestamp=datetime.now(),
+            aggregate_id="model-123",
+            model_id="model-123",
+        )
+        publisher.publish(event)
+        publisher.clear_subscribers()
+
+        handler1.assert_called_once_with(event)
+        handler2.assert_called_once_with(event)
+
+    def test_nested_publish_is_queued_not_reentrant(self):
+        """Test events published by a handler run after the current event."""
+        publisher = DomainEventPublisher()
+        publisher.clear_subscribers()
+        calls = []
+        deleted = ModelDeleted(
+            event_id="e2",
+            timestamp=datetime.now(),
+            aggregate_id="model-123",
+            model_id="model-123",
+        )
+
+        def on_metrics(event):
+            calls.append(("metrics-start", event.event_id))
+            publisher.publish(deleted)
+            calls.append(("metrics-end", event.event_id))
+
+        publisher.subscribe(MetricsRecorded, on_metrics)
+        publisher.subscribe(ModelDeleted, lambda event: calls.append(("deleted", event.event_id)))
+
+        publisher.publish(MetricsRecorded(
+            event_id="e1",
+            timestamp=datetime.now(),
+            aggregate_id="node-456",
+            graph_id="graph-123",
+            node_id="node-456",
+            metrics={"accuracy": 0.95},
+        ))
+        publisher.clear_subscribers()
+
+        assert calls == [
+            ("metrics-start", "e1"),
+            ("metrics-end", "e1"),
+            ("deleted", "e2"),
+        ]
+
+    def test_publish_dispatches_on_calling_thread(self):
+        """Test a publish on one thread is not queued behind another thread's dispatch."""
+        publisher = DomainEventPublisher()
+        publisher.clear_subscribers()
+        calls = []
+        a_dispatching = threading.Event()
+        b_done = threading.Event()
+
+        def on_deleted(event):
+            calls.append((event.model_id, threading.current_thread().name))
+            if event.model_id == "A":
+                a_dispatching.set()
+                b_done.wait(timeout=5)
+
+        def publish(model_id):
+            publisher.publish(ModelDeleted(aggregate_id=model_id, model_id=model_id))
+
+        publisher.subscribe(ModelDeleted, on_deleted)
+        thread_a = threading.Thread(target=publish, args=("A",), name="TA")
+        thread_a.start()
+        a_dispatching.wait(timeout=5)
+        thread_b = threading.Thread(target=publish, args=("B",), name="TB")
+        thread_b.start()
+        thread_b.join(timeout=5)
+        b_done.set()
+        thread_a.join(timeout=5)
+        publisher.clear_subscribers()
+
+        assert calls == [("A", "TA"), ("B", "TB")]
+
+    def test_compiled_dispatch_isolates_errors_and_tracks_subscriptions(self):
+        """Test compiled chains keep per-handler isolation and rebuild on subscribe."""
+        publisher = DomainEventPublisher()
+        publisher.clear_subscribers()
+        failing = Mock(side_effect=RuntimeError("boom"))
+        handler1 = Mock()
+        handler2 = Mock()
+        event = ModelDeleted(
+            event_id="e1",
+            timestamp=datetime.now(),
+            aggregate_id="model-123",
+            model_id="model-123",
+        )
+
+        publisher.bulk_subscribe({ModelDeleted: [failing, handler1]})
+        publisher.compile()
+        publisher.publish(event)
+        publisher.subscribe(ModelDeleted, handler2)
+        publisher.publish(event)
+        publisher.clear_subscribers()
+
+        assert failing.call_count == 2
+        assert handler1.call_count == 2
+        handler2.assert_called_once_with(event)
+
+    def test_base_class_subscribers_receive_subclass_events(self):
+        """Test handlers on a base event type fire after the concrete type's handlers."""
+        publisher = DomainEventPublisher()
+        publisher.clear_subscribers()
+        calls = []
+        publisher.subscribe(ModelDeleted, lambda e: calls.append("specific"))
+        publisher.compile()
+        publisher.subscribe(DomainEvent, lambda e: calls.append("base"))
+
+        publisher.publish(ModelDeleted(aggregate_id="model-123", model_id="model-123"))
+        publisher.clear_subscribers()
+
+        assert calls == ["specific", "base"]
+
+    def test_handler_error_is_logged(self, caplog):
+        """Test handler failures are reported through the module logger."""
+        publisher = DomainEventPublisher()
+        publisher.clear_subscribers()
+        publisher.subscribe(ModelDeleted, Mock(side_effect=RuntimeError("boom")))
+
+        with caplog.at_level(logging.ERROR, logger="app.domain.events"):
+            publisher.publish(ModelDeleted(
+                event_id="e1",
+                timestamp=datetime.now(),
+                aggregate_id="model-123",
+                model_id="model-123",
+            ))
+        publisher.clear_subscribers()
+
+        assert "Event handler error" in caplog.text
+        assert "boom" in caplog.text
+
+
 class TestGlobalEventPublisher:
     """Test the global event publisher instance."""
 
@@ -0,0 +1,32 @@
+"""Tests for domain identifier generation."""
+from __future__ import annotations
+
+import uuid
+
+from app.domain.ids import new_id, new_ordered_id
+
+
+class TestNewId:
+    """Test buffered UUID generation."""
+
+    def test_ids_are_valid_uuid4_strings(self):
+        """Test ids round-trip as canonical version 4 UUIDs."""
+        value = new_id()
+        parsed = uuid.UUID(value)
+
+        assert str(parsed) == value
+        assert parsed.version == 4
+
+    def test_ids_are_unique_across_refills(self):
+        """Test ids stay unique when the random buffer is refilled."""
+        ids = {new_id() for _ in range(1000)}
+
+        assert len(ids) == 1000
+
+    def test_ordered_ids_are_uuid7_in_creation_order(self):
+        """Test ordered ids are version 7 UUIDs that sort by creation."""
+        ids = [new_ordered_id() for _ in range(5000)]
+
+        assert all(uuid.UUID(value).version == 7 for value in ids)
+        assert sorted(ids) == ids
+        assert len(set(ids)) == len(ids)
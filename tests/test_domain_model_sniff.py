@@ -0,0 +1,50 @@
+"""Tests for header-based framework detection."""
+from __future__ import annotations
+
+import gzip
+import io
+import pickle
+import tarfile
+import zipfile
+
+from app.domain.model_sniff import sniff_framework
+from app.domain.strategies import PickleSerializationStrategy
+
+
+class TestSniffFramework:
+    """Test framework detection from payload headers."""
+
+    def test_pickle_protocols(self):
+        """Test protocol 2+ pickles are detected."""
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            assert sniff_framework(pickle.dumps({"a": 1}, protocol=protocol)) == "pickle"
+
+    def test_out_of_band_pickle(self):
+        """Test framed out-of-band pickles are detected."""
+        strategy = PickleSerializationStrategy(out_of_band=True)
+        assert sniff_framework(strategy.serialize({"a": 1})) == "pickle"
+
+    def test_zip_archive_is_torch(self):
+        """Test zip payloads map to the PyTorch strategy."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("archive/data.pkl", b"")
+        assert sniff_framework(buffer.getvalue()) == "pytorch"
+
+    def test_gzip_archive_is_tensorflow(self):
+        """Test tar.gz payloads map to the TensorFlow strategy."""
+        assert sniff_framework(gzip.compress(b"model")) == "tensorflow"
+
+    def test_plain_tar_archive_is_tensorflow(self):
+        """Test uncompressed tar payloads map to the TensorFlow strategy."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            info = tarfile.TarInfo("model/saved_model.pb")
+            tar.addfile(info, io.BytesIO(b""))
+        assert sniff_framework(buffer.getvalue()) == "tensorflow"
+
+    def test_unknown_payload(self):
+        """Test unrecognised or empty payloads return None."""
+        assert sniff_framework(b"") is None
+        assert sniff_framework(b"\x08\x07") is None
+        assert sniff_framework(pickle.dumps([1], protocol=0)) is None
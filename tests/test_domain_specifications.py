@@ -5,7 +5,8 @@ import pytest
 
 from app.domain.specifications import (
     Specification, AndSpecification, OrSpecification, NotSpecification,
-    filter_by_specification
+    filter_by_specification,
+    GraphByName, GraphInProject, ProjectByName,
 )
 
 
@@ -51,6 +52,13 @@ class TestSpecification:
         assert isinstance(not_spec, NotSpecification)
 
 
+    def test_builtin_specifications_are_slotted(self):
+        """Test built-in specifications carry no per-instance __dict__."""
+        spec = ProjectByName("ml").and_(GraphInProject("p1")).not_()
+        
+        assert not hasattr(spec, "__dict__")
+        assert not hasattr(spec.spec.left, "__dict__")
+
 class TestAndSpecification:
     """Test AND specification composition."""
 
@@ -308,3 +316,52 @@ class TestFilterBySpecification:
         assert len(result) == 2
         assert result[0]["id"] == "item1"
         assert result[1]["id"] == "item3"
+
+
+class TestCompiledSpecifications:
+    """Test compiled predicates match the object-tree evaluation."""
+
+    def test_compiled_chain_matches_is_satisfied_by(self):
+        """Test a fused AND/OR/NOT chain agrees with is_satisfied_by."""
+        spec = (
+            GraphInProject("p1")
+            .and_(GraphByName("model"))
+            .and_(GraphByName("v2").not_())
+            .or_(GraphByName("legacy"))
+        )
+        graphs = [
+            {"id": "1", "project_id": "p1", "name": "Model v1"},
+            {"id": "2", "project_id": "p1", "name": "Model v2"},
+            {"id": "3", "project_id": "p2", "name": "Model v1"},
+            {"id": "4", "project_id": "p2", "name": "Legacy"},
+        ]
+        pred = spec.compile()
+
+        for graph in graphs:
+            assert pred(graph) == spec.is_satisfied_by(graph)
+        assert [g["id"] for g in filter_by_specification(graphs, spec)] == ["1", "4"]
+
+    def test_compiled_and_short_circuits(self):
+        """Test later operands are skipped once an AND operand fails."""
+        calls = []
+
+        class Recording(Specification):
+            def __init__(self, name, result):
+                self.name = name
+                self.result = result
+
+            def is_satisfied_by(self, candidate):
+                calls.append(self.name)
+                return self.result
+
+        spec = Recording("a", True).and_(Recording("b", False)).and_(Recording("c", True))
+
+        assert spec.compile()({}) is False
+        assert calls == ["a", "b"]
+
+    def test_empty_name_pattern_matches_everything(self):
+        """Test an empty pattern compiles to a predicate that accepts all items."""
+        projects = [{"name": "Alpha"}, {"name": ""}, {}]
+
+        assert filter_by_specification(projects, ProjectByName("")) == projects
+        assert filter_by_specification(projects, ProjectByName("ALP")) == [{"name": "Alpha"}]
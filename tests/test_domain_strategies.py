@@ -7,7 +7,7 @@ from unittest.mock import Mock
 
 from app.domain.strategies import (
     ModelSerializationStrategy, PickleSerializationStrategy,
-    SerializationStrategyFactory
+    SerializationStrategyFactory, NumpyAwarePickleStrategy, OOB_PICKLE_MAGIC
 )
 from app.domain.errors import ValidationError
 
@@ -61,6 +61,35 @@ class TestPickleSerializationStrategy:
             deserialized = strategy.deserialize(serialized)
             assert deserialized == test_data
 
+    def test_serialize_uses_protocol_5(self):
+        """Test that payloads are written with pickle protocol 5."""
+        strategy = PickleSerializationStrategy()
+        
+        serialized = strategy.serialize({"weights": [1.0, 2.0]})
+        
+        assert serialized[:2] == b"\x80\x05"
+
+    def test_deserialize_accepts_buffers(self):
+        """Test bytearray and memoryview payloads deserialize without conversion."""
+        strategy = PickleSerializationStrategy()
+        serialized = strategy.serialize({"a": 1})
+        
+        assert strategy.deserialize(bytearray(serialized)) == {"a": 1}
+        assert strategy.deserialize(memoryview(serialized)) == {"a": 1}
+
+    def test_out_of_band_roundtrip_returns_buffer_views(self):
+        """Test framed out-of-band payloads round-trip without copying buffers."""
+        payload = bytearray(b"w" * 4096)
+        original = {"weights": pickle.PickleBuffer(payload), "n_features": 4}
+        
+        serialized = PickleSerializationStrategy(out_of_band=True).serialize(original)
+        deserialized = PickleSerializationStrategy().deserialize(serialized)
+        
+        assert serialized[:4] == OOB_PICKLE_MAGIC
+        assert isinstance(deserialized["weights"], memoryview)
+        assert deserialized["weights"].tobytes() == bytes(payload)
+        assert deserialized["n_features"] == 4
+
     def test_serialize_complex_objects(self):
         """Test serializing complex objects."""
         strategy = PickleSerializationStrategy()
@@ -157,14 +186,28 @@ class TestSerializationStrategyFactory:
         assert isinstance(strategy, PickleSerializationStrategy)
 
     def test_factory_singleton_behavior(self):
-        """Test that factory returns new instances (not singleton)."""
+        """Test that factory shares one instance per strategy class."""
         strategy1 = SerializationStrategyFactory.get_strategy("pickle")
-        strategy2 = SerializationStrategyFactory.get_strategy("pickle")
+        strategy2 = SerializationStrategyFactory.get_strategy("SKLEARN")
         
-        # Factory creates new instances each time
-        assert strategy1 is not strategy2
+        # Stateless strategies are reused across lookups and aliases
+        assert strategy1 is strategy2
         assert isinstance(strategy1, PickleSerializationStrategy)
-        assert isinstance(strategy2, PickleSerializationStrategy)
+
+    def test_get_numpy_aware_strategy(self):
+        """Test the array-aware alias frames buffers out-of-band."""
+        strategy = SerializationStrategyFactory.get_strategy("sklearn-numpy")
+        
+        assert isinstance(strategy, NumpyAwarePickleStrategy)
+        assert strategy.serialize({"a": 1})[:4] == OOB_PICKLE_MAGIC
+
+    def test_detect_framework_from_module(self):
+        """Test framework detection from the model's module name."""
+        TorchLike = type("Linear", (), {"__module__": "torch.nn.modules.linear"})
+        
+        assert SerializationStrategyFactory.detect_framework(TorchLike()) == "pytorch"
+        assert SerializationStrategyFactory.detect_framework(TorchLike()) == "pytorch"
+        assert SerializationStrategyFactory.detect_framework({"a": 1}) == "unknown"
 
     def test_factory_multiple_strategies(self):
         """Test factory with multiple strategy types."""
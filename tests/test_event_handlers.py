@@ -0,0 +1,103 @@
+"""Tests for domain event handlers."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from unittest.mock import patch
+
+import orjson
+
+from app.application import event_handlers
+from app.application.event_handlers import AuditLogHandler, NotificationHandler, register_event_handlers
+from app.domain.events import MetricsRecorded, ModelDeleted, ProjectCreated
+
+
+class TestAuditLogHandler:
+    """Test buffered audit logging."""
+
+    def test_audit_records_flushed_in_one_batch(self, caplog):
+        """Test queued audit records are emitted as a single log call."""
+        handler = AuditLogHandler(flush_interval=10.0)
+
+        with caplog.at_level(logging.INFO, logger="app.application.event_handlers"):
+            handler.handle_project_created(ProjectCreated(
+                event_id="e1",
+                timestamp=datetime.now(),
+                aggregate_id="proj-1",
+                name="Project A",
+                description="",
+            ))
+            handler.handle_model_deleted(ModelDeleted(
+                event_id="e2",
+                timestamp=datetime.now(),
+                aggregate_id="model-1",
+                model_id="model-1",
+            ))
+            handler.close()
+
+        audit_records = [r for r in caplog.records if '"event"' in r.getMessage()]
+        assert len(audit_records) == 1
+        lines = [orjson.loads(line) for line in audit_records[0].getMessage().splitlines()]
+        assert lines == [
+            {"event": "project_created", "id": "proj-1", "name": "Project A"},
+            {"event": "model_deleted", "id": "model-1"},
+        ]
+
+    def test_audit_records_dropped_when_buffer_full(self):
+        """Test overflow is counted instead of blocking the publisher."""
+        handler = AuditLogHandler(buffer_size=1, flush_interval=10.0)
+        event = ModelDeleted(
+            event_id="e1",
+            timestamp=datetime.now(),
+            aggregate_id="model-1",
+            model_id="model-1",
+        )
+
+        # The drain thread may pick up at most one record; the rest overflow.
+        for _ in range(5):
+            handler.handle_model_deleted(event)
+
+        assert handler.dropped >= 3
+        handler.close()
+
+
+    def test_close_is_idempotent(self):
+        """Test closing twice neither raises nor blocks."""
+        handler = AuditLogHandler(flush_interval=10.0)
+        handler.close()
+        handler.close()
+
+
+class TestRegisterEventHandlers:
+    """Test handler registration."""
+
+    def test_register_twice_subscribes_once(self):
+        """Test repeated registration does not start more writers or duplicate handlers."""
+        with patch.object(event_handlers, "_registered", False), \
+                patch.object(event_handlers, "_register_handlers") as register:
+            register_event_handlers()
+            register_event_handlers()
+
+        register.assert_called_once_with()
+
+
+class TestNotificationHandler:
+    """Test notification logging."""
+
+    def test_low_accuracy_warning(self, caplog):
+        """Test low accuracy metrics produce a formatted warning."""
+        handler = NotificationHandler()
+        event = MetricsRecorded(
+            event_id="e1",
+            timestamp=datetime.now(),
+            aggregate_id="node-456",
+            graph_id="graph-123",
+            node_id="node-456",
+            metrics={"accuracy": 0.3},
+        )
+
+        with caplog.at_level(logging.WARNING, logger="app.application.event_handlers"):
+            handler.handle_metrics_recorded(event)
+
+        assert "[NOTIFICATION] Low accuracy (0.3) for node node-456" in caplog.text
@@ -5,12 +5,13 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, MagicMock
 
 from app.ursaml.repositories import (
     ProjectsRepository, GraphsRepository, NodesRepository, ModelsRepository
 )
-from app.ursaml.metadata import MetadataStore
+from app.ursaml.metadata import MetadataStore, graph_name_key, project_name_key
+from app.ursaml.storage import UrsaMLStorage
 
 
 class TestMetadataStore:
@@ -74,6 +75,55 @@ class TestMetadataStore:
         finally:
             metadata_file.unlink(missing_ok=True)
 
+    def test_metadata_store_unit_of_work_writes_once(self):
+        """Test saves inside a unit of work are deferred to a single write."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = MetadataStore(Path(temp_dir) / "metadata.json")
+            writes = []
+            store._write = lambda: writes.append(dict(store.data))
+
+            with store.unit_of_work():
+                store.data["projects"]["p1"] = {"id": "p1", "name": "A"}
+                store.save()
+                with store.unit_of_work():
+                    store.data["graphs"]["g1"] = {"id": "g1", "project_id": "p1", "name": "G"}
+                    store.save()
+                assert writes == []
+
+            assert len(writes) == 1
+            assert "g1" in writes[0]["graphs"]
+
+    def test_metadata_store_reloads_after_external_write(self):
+        """Test a long-lived store picks up writes made by another instance."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            metadata_file = Path(temp_dir) / "metadata.json"
+            reader = MetadataStore(metadata_file)
+            writer = MetadataStore(metadata_file)
+
+            writer.data["projects"]["p1"] = {"id": "p1", "name": "Shared"}
+            writer.save()
+
+            assert "p1" in reader.data["projects"]
+            assert reader.ids_with_name(project_name_key("shared")) == {"p1"}
+
+    def test_metadata_store_revision_tracks_changes(self):
+        """Test revision moves on local saves and on reloads of outside writes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            metadata_file = Path(temp_dir) / "metadata.json"
+            reader = MetadataStore(metadata_file)
+            writer = MetadataStore(metadata_file)
+
+            before = reader.revision
+            assert reader.revision == before
+
+            reader.save()
+            saved = reader.revision
+            assert saved != before
+
+            writer.data["projects"]["p1"] = {"id": "p1", "name": "Shared"}
+            writer.save()
+            assert reader.revision != saved
+
     def test_metadata_store_data_property(self):
         """Test metadata data property getter and setter."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
@@ -247,6 +297,64 @@ class TestProjectsRepository:
             assert retrieved is None
 
 
+class TestNameIndex:
+    """Test case-insensitive name index maintained by the metadata store."""
+
+    def test_project_name_index_tracks_create_update_delete(self):
+        """Test project names are indexed case-insensitively."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            metadata_store = MetadataStore(base_path / "metadata.json")
+            repo = ProjectsRepository(base_path, metadata_store)
+
+            project = repo.create("Project A")
+            assert metadata_store.ids_with_name(project_name_key("project a")) == {project["id"]}
+
+            repo.update(project["id"], "Project B", "")
+            assert metadata_store.ids_with_name(project_name_key("PROJECT A")) == set()
+            assert metadata_store.ids_with_name(project_name_key("project b")) == {project["id"]}
+
+            repo.delete(project["id"])
+            assert metadata_store.ids_with_name(project_name_key("project b")) == set()
+
+    def test_graph_name_index_scoped_to_project(self):
+        """Test graph names are indexed per project."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            metadata_store = MetadataStore(base_path / "metadata.json")
+            projects = ProjectsRepository(base_path, metadata_store)
+            graphs = GraphsRepository(base_path, metadata_store)
+
+            project_a = projects.create("A")
+            project_b = projects.create("B")
+            graph = graphs.create(project_a["id"], "Graph One")
+
+            assert metadata_store.ids_with_name(graph_name_key(project_a["id"], "graph one")) == {graph["id"]}
+            assert metadata_store.ids_with_name(graph_name_key(project_b["id"], "graph one")) == set()
+
+    def test_name_index_casefolds_unicode(self):
+        """Test names differing only by Unicode case folding share a key."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            metadata_store = MetadataStore(base_path / "metadata.json")
+            repo = ProjectsRepository(base_path, metadata_store)
+
+            project = repo.create("Straße")
+
+            assert metadata_store.ids_with_name(project_name_key("STRASSE")) == {project["id"]}
+
+    def test_name_index_rebuilt_after_data_replaced(self):
+        """Test replacing data discards the index and rebuilds it lazily."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            metadata_store = MetadataStore(Path(temp_dir) / "metadata.json")
+            metadata_store.data = {
+                "projects": {"p1": {"id": "p1", "name": "Loaded"}},
+                "graphs": {},
+            }
+
+            assert metadata_store.ids_with_name(project_name_key("LOADED")) == {"p1"}
+
+
 class TestGraphsRepository:
     """Test graphs repository functionality."""
 
@@ -328,6 +436,47 @@ class TestGraphsRepository:
             assert graph3["id"] not in graph_ids
 
 
+    def test_all_graphs_across_projects(self):
+        """Test listing every graph in one pass over the metadata index."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            metadata_store = MetadataStore(base_path / "metadata.json")
+            projects = ProjectsRepository(base_path, metadata_store)
+            repo = GraphsRepository(base_path, metadata_store)
+
+            graph1 = repo.create(projects.create("A")["id"], "Graph 1")
+            graph2 = repo.create(projects.create("B")["id"], "Graph 2")
+
+            result = repo.all()
+
+            assert {g["id"] for g in result} == {graph1["id"], graph2["id"]}
+            assert all(g["graph_id"] == g["id"] for g in result)
+
+    def test_read_ursaml_reuses_parse_until_saved(self):
+        """Test read-only graph access reuses the parse until the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            metadata_store = MetadataStore(base_path / "metadata.json")
+            projects = ProjectsRepository(base_path, metadata_store)
+            repo = GraphsRepository(base_path, metadata_store)
+            graph_id = repo.create(projects.create("A")["id"], "Graph 1")["id"]
+            NodesRepository(repo).create(graph_id, "Node")
+
+            first = repo.read_ursaml(graph_id)
+            assert repo.read_ursaml(graph_id) is first
+
+            private = repo.load_ursaml(graph_id)
+            assert private is not first
+            private["nodes"]["n1"]["detailed"]["name"] = "Renamed"
+            repo.save_ursaml(graph_id, private)
+
+            reread = repo.read_ursaml(graph_id)
+            assert reread is not first
+            assert reread["nodes"]["n1"]["detailed"]["name"] == "Renamed"
+
+            repo.delete(graph_id)
+            assert repo.read_ursaml(graph_id) is None
+
 class TestNodesRepository:
     """Test nodes repository functionality."""
 
@@ -415,6 +564,60 @@ class TestNodesRepository:
         assert node2["id"] in node_ids
 
 
+    def test_update_node_does_not_reload_graph(self):
+        """Test update returns the node view without reading the graph again."""
+        graphs_repo = MagicMock()
+        graphs_repo.load_ursaml.return_value = {
+            "nodes": {"n1": {"columns": {"name": "Node"}, "detailed": {"model_id": "m1"}}},
+            "structure": [],
+        }
+        
+        repo = NodesRepository(graphs_repo)
+        result = repo.update("graph-123", "n1", {"model_id": "m2"})
+        
+        assert result["model_id"] == "m2"
+        assert result["name"] == "Node"
+        graphs_repo.load_ursaml.assert_called_once_with("graph-123")
+        graphs_repo.save_ursaml.assert_called_once()
+
+    def test_metrics_for_graph_reads_graph_once(self):
+        """Test per-node metrics come from a single graph read."""
+        graphs_repo = Mock()
+        graphs_repo.read_ursaml.return_value = {
+            "nodes": {
+                "n1": {"columns": {"name": "A"}, "detailed": {"meta": {"score": 0.9}}},
+                "n2": {"columns": {"name": "B"}, "detailed": {}},
+            },
+            "structure": [],
+        }
+        
+        repo = NodesRepository(graphs_repo)
+        result = repo.metrics_for_graph("graph-123")
+        
+        assert result == {"n1": {"score": 0.9}, "n2": {}}
+        graphs_repo.read_ursaml.assert_called_once_with("graph-123")
+
+    def test_structure_for_graph_reads_graph_once(self):
+        """Test nodes and edges come from a single graph read."""
+        graphs_repo = Mock()
+        graphs_repo.read_ursaml.return_value = {
+            "nodes": {
+                "n1": {"columns": {"name": "A"}, "detailed": {"model_id": "m1"}},
+                "n2": {"columns": {"name": "B"}, "detailed": {}},
+            },
+            "structure": [("n1", "n2", 0.5, "default")],
+        }
+        
+        repo = NodesRepository(graphs_repo)
+        nodes, edges = repo.structure_for_graph("graph-123")
+        
+        assert [n["id"] for n in nodes] == ["n1", "n2"]
+        assert edges == [{
+            "source_id": "n1", "target_id": "n2", "weight": 0.5,
+            "type": "default", "graph_id": "graph-123",
+        }]
+        graphs_repo.read_ursaml.assert_called_once_with("graph-123")
+
 class TestModelsRepository:
     """Test models repository functionality."""
 
@@ -483,3 +686,33 @@ class TestModelsRepository:
             
             result = repo.get("nonexistent-model")
             assert result is None
+
+
+class TestProjectGraphsJson:
+    """Test the encoded project graph listing cached on the storage."""
+
+    def test_listing_refreshed_after_graph_change(self):
+        """Test a cached listing is reused until metadata changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = UrsaMLStorage(temp_dir)
+            project = storage.create_project("Project")
+            graph = storage.create_graph(project["id"], "Graph 1")
+
+            first = storage.get_project_graphs_json(project["id"])
+            assert storage.get_project_graphs_json(project["id"]) is first
+            assert [g["graph_id"] for g in json.loads(first)] == [graph["id"]]
+
+            storage.create_graph(project["id"], "Graph 2")
+            names = [g["name"] for g in json.loads(storage.get_project_graphs_json(project["id"]))]
+            assert sorted(names) == ["Graph 1", "Graph 2"]
+
+    def test_listing_not_shared_between_storages(self):
+        """Test each storage instance serves only its own listings."""
+        with tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+            first = UrsaMLStorage(first_dir)
+            second = UrsaMLStorage(second_dir)
+            project = first.create_project("Project")
+            first.create_graph(project["id"], "Graph 1")
+
+            assert json.loads(first.get_project_graphs_json(project["id"]))
+            assert json.loads(second.get_project_graphs_json(project["id"])) == []